@@ -5,15 +5,41 @@ Performs NLP analysis and generates trading signals.
 """
 
 import argparse
-import json
+import os
 import sys
 from pathlib import Path
 
+import joblib
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from src import load_config, setup_logging, ParquetStorage
 from src.analyzer import TextProcessor, SignalGenerator
 
+# Columns consumed by feature extraction, signal generation and aggregation
+INPUT_COLUMNS = [
+    'tweet_id', 'username', 'timestamp', 'content', 'hashtags',
+    'likes', 'retweets', 'replies', 'views',
+]
+
+# On-disk cache for results that only change when the input data does
+memory = joblib.Memory('.cache', verbose=0)
+
+
+def fingerprint_input(input_path):
+    """(path, mtime_ns, size) of the input file, or of every part file of a dataset directory."""
+    path = Path(input_path)
+    parts = sorted(p for p in path.rglob('*.parquet') if p.is_file()) if path.is_dir() else [path]
+    return tuple((str(part), stat.st_mtime_ns, stat.st_size) for part, stat in ((p, p.stat()) for p in parts))
+
+
+@memory.cache(ignore=['text_processor', 'texts'])
+def compute_top_terms(input_path, input_fingerprint, text_features, top_n, text_processor, texts):
+    """Top TF-IDF terms, cached on (input path, input fingerprint, TF-IDF settings, top_n)."""
+    return text_processor.get_top_terms(texts, top_n=top_n)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Analyze tweets and generate signals")
@@ -24,7 +50,8 @@ def main():
     
     # Setup
     config = load_config(args.config)
-    logger = setup_logging(config.get_all())
+    cfg = config.get_all()
+    logger = setup_logging(cfg)
     
     logger.info("=" * 70)
     logger.info("TWITTER ANALYSIS & SIGNAL GENERATION")
@@ -32,24 +59,31 @@ def main():
     
     # Load data
     logger.info(f"Loading data from {args.input}...")
-    tweets_df = pd.read_parquet(args.input)
+    tweets_df = pd.read_parquet(args.input, engine='pyarrow', columns=INPUT_COLUMNS, dtype_backend='pyarrow')
     logger.info(f"Loaded {len(tweets_df)} tweets")
     
     # Feature extraction
     logger.info("\nExtracting features...")
-    text_processor = TextProcessor(config.get_all(), logger)
+    text_processor = TextProcessor(cfg, logger)
     features_df = text_processor.process_tweets(tweets_df)
     
     # Get top terms
-    texts = features_df['content'].tolist()
-    top_terms = text_processor.get_top_terms(texts, top_n=20)
+    texts = features_df['content']
+    top_terms = compute_top_terms(
+        str(Path(args.input).resolve()),
+        fingerprint_input(args.input),
+        text_processor.text_features_config,
+        20,
+        text_processor,
+        texts
+    )
     logger.info("\nTop 20 Terms by TF-IDF:")
     for i, (term, score) in enumerate(top_terms, 1):
         logger.info(f"  {i}. {term}: {score:.4f}")
     
     # Generate signals
     logger.info("\nGenerating trading signals...")
-    signal_generator = SignalGenerator(config.get_all(), logger)
+    signal_generator = SignalGenerator(cfg, logger)
     signals_df = signal_generator.generate_signals(features_df)
     
     # Aggregate by hashtag
@@ -64,29 +98,47 @@ def main():
     output_path = Path(args.output)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    signals_df.to_parquet(output_path / 'signals_with_features.parquet', index=False)
+    # Arrow-backed list columns record a pandas dtype string that pandas 2.1 cannot
+    # parse back, so drop the pandas schema metadata (no index is stored anyway)
+    signals_table = pa.Table.from_pandas(signals_df, preserve_index=False).replace_schema_metadata(None)
+    # Same row groups as ParquetStorage.save_analysis_results: at least
+    # row_group_size rows each, and at most one group per CPU
+    row_group_size = cfg.get('storage', {}).get('parquet', {}).get('row_group_size', 262_144)
+    pq.write_table(
+        signals_table,
+        output_path / 'signals_with_features.parquet',
+        row_group_size=max(row_group_size, len(signals_df) // (os.cpu_count() or 1)),
+        compression='zstd', compression_level=3
+    )
     logger.info(f"Saved signals to {output_path / 'signals_with_features.parquet'}")
     
     if len(aggregated_df) > 0:
-        aggregated_df.to_parquet(output_path / 'aggregated_signals.parquet')
+        aggregated_df.to_parquet(
+            output_path / 'aggregated_signals.parquet',
+            engine='pyarrow', compression='zstd', compression_level=3
+        )
         logger.info(f"Saved aggregated signals to {output_path / 'aggregated_signals.parquet'}")
         
         logger.info("\nTop Hashtags by Signal:")
         print(aggregated_df.head(10))
     
-    with open(output_path / 'trading_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    (output_path / 'trading_report.json').write_bytes(
+        orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
     logger.info(f"Saved report to {output_path / 'trading_report.json'}")
     
     # Print summary
-    logger.info("\n" + "=" * 70)
-    logger.info("SUMMARY")
-    logger.info("=" * 70)
-    logger.info(f"Total Tweets: {report['summary']['total_tweets']}")
-    logger.info(f"Market Sentiment: {report['summary']['market_sentiment']}")
-    logger.info(f"Average Signal: {report['summary']['avg_signal']:.3f}")
-    logger.info(f"Bullish: {report['distribution']['bullish_pct']:.1f}%")
-    logger.info(f"Bearish: {report['distribution']['bearish_pct']:.1f}%")
+    lines = [
+        "\n" + "=" * 70,
+        "SUMMARY",
+        "=" * 70,
+        f"Total Tweets: {report['summary']['total_tweets']}",
+        f"Market Sentiment: {report['summary']['market_sentiment']}",
+        f"Average Signal: {report['summary']['avg_signal']:.3f}",
+        f"Bullish: {report['distribution']['bullish_pct']:.1f}%",
+        f"Bearish: {report['distribution']['bearish_pct']:.1f}%",
+    ]
+    logger.info("\n".join(lines))
     
     logger.info("\n Analysis complete!")
     return 0
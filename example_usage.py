@@ -27,14 +27,14 @@ def main():
     config = load_config("config.yaml")
     
     # Setup logging
-    logger = setup_logging(config.get_all())
+    scraper_config = config.get_all()
+    logger = setup_logging(scraper_config)
     logger.info("=" * 50)
     logger.info("Twitter Market Intelligence System - Part 1")
     logger.info("=" * 50)
     
     # Initialize components
     logger.info("Initializing components...")
-    scraper_config = config.get_all()
     
     # Get scraping parameters
     hashtags = config.get("scraper", "hashtags")
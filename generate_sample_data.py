@@ -4,9 +4,9 @@ Generate sample tweet data for testing the analysis pipeline.
 Use this if you want to test the analysis features without scraping.
 """
 
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 from pathlib import Path
 
 print("=" * 70)
@@ -41,57 +41,73 @@ NEUTRAL_TEMPLATES = [
 HASHTAGS = ["#nifty50", "#sensex", "#banknifty", "#intraday", "#trading", "#stockmarket"]
 USERNAMES = [f"trader_{i}" for i in range(1, 21)]
 
-def generate_tweets(num_tweets=100):
-    """Generate sample tweets with realistic data."""
-    tweets = []
-    
-    for i in range(num_tweets):
-        # Random sentiment distribution: 40% bullish, 30% bearish, 30% neutral
-        rand = random.random()
-        if rand < 0.4:
-            content = random.choice(BULLISH_TEMPLATES)
-            base_likes = random.randint(50, 500)
-        elif rand < 0.7:
-            content = random.choice(BEARISH_TEMPLATES)
-            base_likes = random.randint(30, 400)
-        else:
-            content = random.choice(NEUTRAL_TEMPLATES)
-            base_likes = random.randint(20, 300)
-        
-        # Random timestamp within last 24 hours
-        hours_ago = random.randint(0, 23)
-        minutes_ago = random.randint(0, 59)
-        timestamp = datetime.now() - timedelta(hours=hours_ago, minutes=minutes_ago)
-        
-        # Random engagement metrics
-        likes = base_likes + random.randint(-50, 100)
-        retweets = int(likes * random.uniform(0.1, 0.3))
-        replies = int(likes * random.uniform(0.05, 0.15))
-        views = int(likes * random.uniform(10, 50))
-        
-        # Random hashtags (2-4 per tweet)
-        num_tags = random.randint(2, 4)
-        tweet_hashtags = random.sample(HASHTAGS, num_tags)
-        
-        tweet = {
-            'tweet_id': f'sample_tweet_{i:04d}',
-            'username': random.choice(USERNAMES),
-            'timestamp': timestamp.isoformat(),
-            'content': content,
-            'hashtags': tweet_hashtags,
-            'hashtags_lower': [h.lower() for h in tweet_hashtags],
-            'mentions': [f'@user{random.randint(1, 5)}'] if random.random() > 0.5 else [],
-            'likes': max(0, likes),
-            'retweets': max(0, retweets),
-            'replies': max(0, replies),
-            'views': max(0, views),
-            'scraped_at': datetime.now().isoformat(),
-            'is_valid': True
-        }
-        
-        tweets.append(tweet)
-    
-    return tweets
+# Sentiment bucket codes drawn by generate_tweets
+BULLISH, BEARISH, NEUTRAL = 0, 1, 2
+
+def generate_tweets(num_tweets=100, seed=None):
+    """
+    Generate sample tweets with realistic data as a columnar DataFrame.
+    
+    Returns the DataFrame together with the per-tweet sentiment bucket
+    (BULLISH / BEARISH / NEUTRAL) each tweet's template was drawn from.
+    """
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    
+    templates = np.array(BULLISH_TEMPLATES + BEARISH_TEMPLATES + NEUTRAL_TEMPLATES, dtype=object)
+    template_offsets = np.array([0, len(BULLISH_TEMPLATES), len(BULLISH_TEMPLATES) + len(BEARISH_TEMPLATES)])
+    template_counts = np.array([len(BULLISH_TEMPLATES), len(BEARISH_TEMPLATES), len(NEUTRAL_TEMPLATES)])
+    
+    # Random sentiment distribution: 40% bullish, 30% bearish, 30% neutral
+    sentiment = rng.choice([BULLISH, BEARISH, NEUTRAL], size=num_tweets, p=[0.4, 0.3, 0.3])
+    template_idx = template_offsets[sentiment] + rng.integers(0, template_counts[sentiment])
+    content = templates[template_idx]
+    
+    # Base likes per sentiment bucket (inclusive upper bounds)
+    likes_low = np.array([50, 30, 20])
+    likes_high = np.array([500, 400, 300])
+    base_likes = rng.integers(likes_low[sentiment], likes_high[sentiment] + 1)
+    
+    # Random timestamp within last 24 hours (minute resolution)
+    minutes_ago = rng.integers(0, 24 * 60, size=num_tweets)
+    timestamps = pd.Timestamp(now) - pd.to_timedelta(minutes_ago, unit='m')
+    
+    # Random engagement metrics
+    likes = base_likes + rng.integers(-50, 101, size=num_tweets)
+    retweets = (likes * rng.uniform(0.1, 0.3, size=num_tweets)).astype(np.int64)
+    replies = (likes * rng.uniform(0.05, 0.15, size=num_tweets)).astype(np.int64)
+    views = (likes * rng.uniform(10, 50, size=num_tweets)).astype(np.int64)
+    
+    # Random hashtags (2-4 distinct per tweet): shuffle tag indices per row, keep a prefix
+    hashtag_pool = np.array(HASHTAGS, dtype=object)
+    tag_order = rng.random((num_tweets, len(HASHTAGS))).argsort(axis=1)
+    num_tags = rng.integers(2, 5, size=num_tweets)
+    tweet_hashtags = [hashtag_pool[order[:k]].tolist() for order, k in zip(tag_order, num_tags)]
+    
+    # Mentions for roughly half of the tweets
+    has_mention = rng.random(num_tweets) > 0.5
+    mention_ids = rng.integers(1, 6, size=num_tweets)
+    mentions = [[f'@user{m}'] if flag else [] for flag, m in zip(has_mention, mention_ids)]
+    
+    usernames = np.array(USERNAMES, dtype=object)[rng.integers(0, len(USERNAMES), size=num_tweets)]
+    
+    df = pd.DataFrame({
+        'tweet_id': [f'sample_tweet_{i:04d}' for i in range(num_tweets)],
+        'username': usernames,
+        'timestamp': timestamps.strftime('%Y-%m-%dT%H:%M:%S.%f'),
+        'content': content,
+        'hashtags': tweet_hashtags,
+        'hashtags_lower': [[h.lower() for h in tags] for tags in tweet_hashtags],
+        'mentions': mentions,
+        'likes': np.maximum(likes, 0),
+        'retweets': np.maximum(retweets, 0),
+        'replies': np.maximum(replies, 0),
+        'views': np.maximum(views, 0),
+        'scraped_at': now.isoformat(),
+        'is_valid': True
+    })
+    
+    return df, sentiment
 
 def main():
     # Create data directories
@@ -104,22 +120,16 @@ def main():
     # Generate tweets
     num_tweets = 200  # Generate 200 sample tweets
     print(f"\nGenerating {num_tweets} sample tweets...")
-    tweets = generate_tweets(num_tweets)
-    
-    # Create DataFrame
-    df = pd.DataFrame(tweets)
+    df, sentiment = generate_tweets(num_tweets)
     
-    # Calculate some stats
-    bullish_count = len([t for t in tweets if any(word in t['content'].lower() 
-                         for word in ['rally', 'bullish', 'breakout', 'momentum', 'bull'])])
-    bearish_count = len([t for t in tweets if any(word in t['content'].lower() 
-                         for word in ['crash', 'bearish', 'breakdown', 'pressure', 'bear'])])
+    # Calculate some stats from the sentiment bucket recorded at generation time
+    bullish_count, bearish_count, _ = np.bincount(sentiment, minlength=3).tolist()
     
     print(f"\nGenerated tweets:")
-    print(f"  Total: {len(tweets)}")
-    print(f"  Bullish: {bullish_count} ({bullish_count/len(tweets)*100:.1f}%)")
-    print(f"  Bearish: {bearish_count} ({bearish_count/len(tweets)*100:.1f}%)")
-    print(f"  Neutral: {len(tweets)-bullish_count-bearish_count}")
+    print(f"  Total: {len(df)}")
+    print(f"  Bullish: {bullish_count} ({bullish_count/len(df)*100:.1f}%)")
+    print(f"  Bearish: {bearish_count} ({bearish_count/len(df)*100:.1f}%)")
+    print(f"  Neutral: {len(df)-bullish_count-bearish_count}")
     
     # Save as raw data
     raw_path = raw_dir / "tweets_raw.parquet"
@@ -134,9 +144,9 @@ def main():
     # Show sample
     print("\nSample tweets:")
     print("-" * 70)
-    for i in range(min(3, len(tweets))):
-        print(f"{i+1}. {tweets[i]['content']}")
-        print(f"   Engagement: {tweets[i]['likes']} likes, {tweets[i]['retweets']} retweets")
+    for i, tweet in enumerate(df.head(3).itertuples(index=False), 1):
+        print(f"{i}. {tweet.content}")
+        print(f"   Engagement: {tweet.likes} likes, {tweet.retweets} retweets")
         print()
     
     print("=" * 70)
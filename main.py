@@ -5,12 +5,14 @@ Complete pipeline from scraping to signal generation.
 """
 
 import argparse
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from src import (
     TwitterScraper,
@@ -90,21 +92,23 @@ def run_processing_pipeline(config, logger):
     logger.info("PHASE 2: DATA PROCESSING")
     logger.info("=" * 70)
     
+    cfg = config.get_all()
+    
     try:
-        storage = ParquetStorage(config.get_all(), logger)
-        tweets_df = storage.load_raw_tweets()
+        storage = ParquetStorage(cfg, logger)
         
-        if len(tweets_df) == 0:
+        # Row count comes from the Parquet footer, so empty input is never loaded
+        if storage.count_raw_tweets() == 0:
             logger.warning("No raw data found")
             return 0
         
-        tweets = tweets_df.to_dict('records')
+        tweets_df = storage.load_raw_tweets()
         
-        cleaner = DataCleaner(config.get_all(), logger)
-        cleaned_tweets = cleaner.clean_batch(tweets)
+        cleaner = DataCleaner(cfg, logger)
+        cleaned_df = cleaner.clean_dataframe(tweets_df)
         
-        deduplicator = Deduplicator(config.get_all(), logger)
-        unique_tweets = deduplicator.deduplicate(cleaned_tweets)
+        deduplicator = Deduplicator(cfg, logger)
+        unique_tweets = deduplicator.deduplicate_dataframe(cleaned_df)
         
         storage.save_processed_tweets(unique_tweets)
         logger.info(f"✓ Processed {len(unique_tweets)} unique tweets")
@@ -120,20 +124,23 @@ def run_analysis_pipeline(config, logger, output_dir):
     logger.info("PHASE 3: NLP ANALYSIS & SIGNAL GENERATION")
     logger.info("=" * 70)
     
+    cfg = config.get_all()
+    
     try:
-        storage = ParquetStorage(config.get_all(), logger)
-        tweets_df = storage.load_processed_tweets()
+        storage = ParquetStorage(cfg, logger)
         
-        if len(tweets_df) == 0:
+        if storage.count_processed_tweets() == 0:
             logger.warning("No processed data found")
             return None, None, None
         
+        tweets_df = storage.load_processed_tweets()
+        
         # Feature extraction
-        text_processor = TextProcessor(config.get_all(), logger)
+        text_processor = TextProcessor(cfg, logger)
         features_df = text_processor.process_tweets(tweets_df)
         
         # Signal generation
-        signal_generator = SignalGenerator(config.get_all(), logger)
+        signal_generator = SignalGenerator(cfg, logger)
         signals_df = signal_generator.generate_signals(features_df)
         aggregated_df = signal_generator.aggregate_signals(signals_df, 'hashtags', min_tweets=3)
         report = signal_generator.generate_trading_report(signals_df)
@@ -144,11 +151,18 @@ def run_analysis_pipeline(config, logger, output_dir):
         
         storage.save_analysis_results(signals_df, 'signals_with_features.parquet')
         
-        if len(aggregated_df) > 0:
-            aggregated_df.to_parquet(output_path / 'aggregated_signals.parquet')
+        if len(aggregated_df.index) > 0:
+            # aggregate_signals already orders rows strongest-signal first; the
+            # hashtag index is kept as a column
+            pq.write_table(
+                pa.Table.from_pandas(aggregated_df, preserve_index=True),
+                output_path / 'aggregated_signals.parquet',
+                compression='zstd', compression_level=3
+            )
         
-        with open(output_path / 'trading_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        (output_path / 'trading_report.json').write_bytes(
+            orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
         
         logger.info(f"✓ Analysis complete. Results saved to {output_dir}")
         print_analysis_summary(report, logger)
@@ -159,28 +173,38 @@ def run_analysis_pipeline(config, logger, output_dir):
         return None, None, None
 
 
-def run_visualization_pipeline(config, logger, output_dir):
-    """Run visualization pipeline."""
+def run_visualization_pipeline(config, logger, output_dir, signals_df=None, aggregated_df=None):
+    """
+    Run visualization pipeline.
+    
+    Uses the in-memory results of the analysis phase when given, otherwise
+    loads them from disk (standalone --visualize).
+    """
     logger.info("\n" + "=" * 70)
     logger.info("PHASE 4: VISUALIZATION")
     logger.info("=" * 70)
     
     try:
-        import pandas as pd
-        from pathlib import Path
+        if signals_df is None:
+            # Load signals data directly with pandas
+            signals_path = Path('data/analysis/signals_with_features.parquet')
+            if not signals_path.exists():
+                logger.warning("No analysis data found. Run analysis first: python main.py --analyze")
+                return False
+            
+            if pq.read_metadata(signals_path).num_rows == 0:
+                logger.warning("No analysis data found")
+                return False
+            
+            signals_df = pd.read_parquet(
+                signals_path, engine='pyarrow', columns=Visualizer.REQUIRED_COLUMNS, dtype_backend='pyarrow'
+            )
         
-        # Load signals data directly with pandas
-        signals_path = Path('data/analysis/signals_with_features.parquet')
-        if not signals_path.exists():
-            logger.warning("No analysis data found. Run analysis first: python main.py --analyze")
-            return False
-        
-        signals_df = pd.read_parquet(signals_path)
+        if aggregated_df is None:
+            aggregated_path = Path('data/analysis/aggregated_signals.parquet')
+            aggregated_df = pd.read_parquet(aggregated_path, engine='pyarrow', dtype_backend='pyarrow') if aggregated_path.exists() else pd.DataFrame()
         
-        aggregated_path = Path('data/analysis/aggregated_signals.parquet')
-        aggregated_df = pd.read_parquet(aggregated_path) if aggregated_path.exists() else pd.DataFrame()
-        
-        if len(signals_df) == 0:
+        if len(signals_df.index) == 0:
             logger.warning("No analysis data found")
             return False
         
@@ -197,23 +221,27 @@ def run_visualization_pipeline(config, logger, output_dir):
 
 def print_analysis_summary(report, logger):
     """Print analysis summary."""
-    logger.info("\n" + "=" * 70)
-    logger.info("ANALYSIS SUMMARY")
-    logger.info("=" * 70)
-    
     summary = report['summary']
     distribution = report['distribution']
     
-    logger.info(f"Total Tweets: {summary['total_tweets']}")
-    logger.info(f"Average Signal: {summary['avg_signal']:.3f}")
-    logger.info(f"Market Sentiment: {summary['market_sentiment']}")
-    logger.info(f"\nBullish: {distribution['bullish']} ({distribution['bullish_pct']:.1f}%)")
-    logger.info(f"Bearish: {distribution['bearish']} ({distribution['bearish_pct']:.1f}%)")
+    lines = [
+        "\n" + "=" * 70,
+        "ANALYSIS SUMMARY",
+        "=" * 70,
+        f"Total Tweets: {summary['total_tweets']}",
+        f"Average Signal: {summary['avg_signal']:.3f}",
+        f"Market Sentiment: {summary['market_sentiment']}",
+        f"\nBullish: {distribution['bullish']} ({distribution['bullish_pct']:.1f}%)",
+        f"Bearish: {distribution['bearish']} ({distribution['bearish_pct']:.1f}%)",
+    ]
     
     if report['top_hashtags']:
-        logger.info("\nTop 5 Hashtags:")
+        lines.append("\nTop 5 Hashtags:")
         for i, (hashtag, data) in enumerate(list(report['top_hashtags'].items())[:5], 1):
-            logger.info(f"  {i}. {hashtag}: {data['composite_signal_mean']:.3f} - {data['recommendation']}")
+            lines.append(f"  {i}. {hashtag}: {data['composite_signal_mean']:.3f} - {data['recommendation']}")
+    
+    # One record through the handler chain instead of one per line
+    logger.info("\n".join(lines))
 
 
 def main():
@@ -235,6 +263,8 @@ def main():
         logger.warning("No action specified. Use --all or specify phases")
         return 1
     
+    signals_df, aggregated_df = None, None
+    
     try:
         if args.all or args.scrape:
             if run_scraping_pipeline(config, logger, args.target, args.hashtags) == 0:
@@ -245,11 +275,16 @@ def main():
                 return 1
         
         if args.all or args.analyze:
-            if run_analysis_pipeline(config, logger, args.output)[0] is None:
+            signals_df, aggregated_df, _ = run_analysis_pipeline(config, logger, args.output)
+            if signals_df is None:
                 return 1
         
         if args.all or args.visualize:
-            run_visualization_pipeline(config, logger, args.output)
+            # Reuse the analysis results in memory rather than re-reading them
+            run_visualization_pipeline(
+                config, logger, args.output,
+                signals_df=signals_df, aggregated_df=aggregated_df
+            )
         
         logger.info("\n[SUCCESS] PIPELINE COMPLETE")
         return 0
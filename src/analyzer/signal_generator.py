@@ -3,10 +3,13 @@ Signal generation module for algorithmic trading.
 Converts text features into quantitative trading signals with confidence intervals.
 """
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from scipy.stats import norm
 
 from ..utils import Logger
 
@@ -14,6 +17,22 @@ from ..utils import Logger
 class SignalGenerator:
     """Generate trading signals from tweet features."""
     
+    # Fixed label set for the categorical signal_direction column
+    SIGNAL_DIRECTIONS = ['bearish', 'bullish']
+    
+    # Two-sided z-scores for common confidence levels; others fall back to the normal quantile
+    Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+    
+    # Feature columns read by generate_signals, with the value used when a column is absent
+    FEATURE_DEFAULTS = {
+        'likes': 0, 'retweets': 0, 'replies': 0,
+        'polarity': 0.0, 'subjectivity': 0.5,
+        'bullish_score': 0.5, 'bearish_score': 0.5, 'confidence': 0.5,
+        'urgency_score': 0.0,
+        'bullish_terms_count': 0, 'bearish_terms_count': 0,
+        'has_price': False, 'has_percentage': False,
+    }
+    
     def __init__(self, config: dict, logger: Logger = None):
         """
         Initialize signal generator.
@@ -34,6 +53,14 @@ class SignalGenerator:
             'technical_terms': 0.2
         })
         
+        # Component weights in (sentiment, engagement, urgency, technical) order for the vectorized path
+        self.weight_vector = np.array([
+            self.signal_weights.get('sentiment', 0.3),
+            self.signal_weights.get('engagement', 0.3),
+            self.signal_weights.get('urgency', 0.2),
+            self.signal_weights.get('technical_terms', 0.2)
+        ], dtype=np.float32)
+        
         self.logger.info(f"SignalGenerator initialized with weights: {self.signal_weights}")
     
     def calculate_engagement_score(self, row: pd.Series) -> float:
@@ -195,8 +222,7 @@ class SignalGenerator:
         )
         
         # Calculate margin of error
-        # Z-score for 95% confidence ≈ 1.96
-        z_score = 1.96 if confidence_level == 0.95 else 2.576  # 99%
+        z_score = self.get_z_score(confidence_level)
         margin = z_score * uncertainty * 0.5  # Scale down
         
         lower = np.clip(signal - margin, -1, 1)
@@ -204,40 +230,127 @@ class SignalGenerator:
         
         return (lower, upper)
     
-    def generate_signals(self, tweets_df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def get_z_score(cls, confidence_level: float) -> float:
+        """
+        Get the two-sided z-score for a confidence level.
+        
+        Args:
+            confidence_level: Confidence level (e.g. 0.95)
+            
+        Returns:
+            Z-score from the lookup table, or the normal quantile otherwise
+        """
+        z_score = cls.Z_SCORES.get(confidence_level)
+        if z_score is None:
+            z_score = float(norm.ppf((1 + confidence_level) / 2))
+        return z_score
+    
+    @staticmethod
+    def _feature_array(df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+        """
+        Read a feature column as a float32 array, falling back to a constant.
+        
+        Args:
+            df: DataFrame with features
+            column: Column name
+            default: Value used when the column is missing
+            
+        Returns:
+            Float32 array with one value per row
+        """
+        if column not in df.columns:
+            return np.full(len(df.index), default, dtype=np.float32)
+        return df[column].to_numpy(dtype=np.float32, na_value=np.nan)
+    
+    def generate_signals(self, tweets_df: pd.DataFrame, confidence_level: float = 0.95) -> pd.DataFrame:
         """
         Generate trading signals for all tweets.
         
+        Computes the same components as calculate_composite_signal and
+        calculate_confidence_interval, column-wise over the whole frame.
+        All signal columns are float32; every value lies in [-1, 1].
+        
         Args:
             tweets_df: DataFrame with processed tweets
+            confidence_level: Confidence level of the signal interval (default 0.95)
             
         Returns:
-            DataFrame with generated signals
+            DataFrame with generated signals (shares column data with tweets_df)
         """
         self.logger.info(f"Generating signals for {len(tweets_df)} tweets...")
         
-        signals_list = []
+        # Resolve the input schema once; absent columns become constant default arrays
+        missing = [column for column in self.FEATURE_DEFAULTS if column not in tweets_df.columns]
+        if missing:
+            self.logger.debug(f"Using defaults for missing feature columns: {missing}")
+        features = {
+            column: self._feature_array(tweets_df, column, default)
+            for column, default in self.FEATURE_DEFAULTS.items()
+        }
         
-        for idx, row in tweets_df.iterrows():
-            # Calculate composite signal
-            signals = self.calculate_composite_signal(row)
-            
-            # Calculate confidence interval
-            lower, upper = self.calculate_confidence_interval(
-                signals['composite_signal'],
-                row
-            )
-            signals['confidence_lower'] = lower
-            signals['confidence_upper'] = upper
-            signals['confidence_width'] = upper - lower
-            
-            signals_list.append(signals)
+        # Engagement score (log-normalized weighted engagement)
+        engagement = features['likes'] * 1.0 + features['retweets'] * 2.0 + features['replies'] * 1.5
+        positive = engagement > 0
+        engagement_score = np.where(
+            positive, np.minimum(1.0, np.log1p(np.where(positive, engagement, 0.0)) / 10.0), 0.0
+        )
         
-        # Create signals DataFrame
-        signals_df = pd.DataFrame(signals_list)
+        # Sentiment signal (general polarity + market sentiment)
+        market_signal = features['bullish_score'] - features['bearish_score']
+        sentiment_signal = np.clip(features['polarity'] * 0.4 + market_signal * 0.6, -1, 1)
+        
+        urgency_signal = features['urgency_score']
+        
+        # Technical signal from term counts, boosted on price/percentage mentions
+        bullish_count = features['bullish_terms_count']
+        total_terms = bullish_count + features['bearish_terms_count']
+        # Branchless: divide by max(total, 1) unconditionally, boost is 1.2 or 1.0 per row
+        technical_signal = np.where(total_terms > 0, bullish_count / np.maximum(total_terms, 1), 0.5)
+        has_numbers = (features['has_price'] != 0) | (features['has_percentage'] != 0)
+        technical_signal *= 1.0 + np.float32(0.2) * has_numbers
+        np.minimum(technical_signal, 1.0, out=technical_signal)
+        
+        # Composite signal, normalized from 0-1 to -1-1 (bearish to bullish)
+        components = np.column_stack([sentiment_signal, engagement_score, urgency_signal, technical_signal])
+        composite_signal = (components @ self.weight_vector * 2) - 1
+        
+        # Confidence interval from engagement, subjectivity and market confidence.
+        # Built in place on two buffers; feature arrays may be views of tweets_df, so never modify them.
+        uncertainty = np.subtract(1, engagement_score)
+        uncertainty *= 0.4
+        scratch = np.multiply(features['subjectivity'], 0.3)
+        uncertainty += scratch
+        np.subtract(1, features['confidence'], out=scratch)
+        scratch *= 0.3
+        uncertainty += scratch
+        margin = uncertainty
+        margin *= self.get_z_score(confidence_level)
+        margin *= 0.5
+        confidence_lower = np.subtract(composite_signal, margin, out=scratch)
+        np.clip(confidence_lower, -1, 1, out=confidence_lower)
+        confidence_upper = np.add(composite_signal, margin, out=margin)
+        np.clip(confidence_upper, -1, 1, out=confidence_upper)
+        
+        signals = {
+            'sentiment_signal': sentiment_signal,
+            'engagement_score': engagement_score,
+            'urgency_signal': urgency_signal,
+            'technical_signal': technical_signal,
+            'composite_signal': composite_signal,
+            'signal_strength': np.abs(composite_signal),
+            'signal_direction': pd.Categorical.from_codes(
+                (composite_signal > 0).astype(np.int8), categories=self.SIGNAL_DIRECTIONS
+            ),
+            'confidence_lower': confidence_lower,
+            'confidence_upper': confidence_upper,
+            'confidence_width': confidence_upper - confidence_lower,
+        }
         
-        # Combine with original data
-        result = pd.concat([tweets_df.reset_index(drop=True), signals_df], axis=1)
+        # Attach signal columns to a shallow copy; concatenating would copy every tweet column
+        result = tweets_df.set_axis(pd.RangeIndex(len(tweets_df.index)), copy=False)
+        for column, values in signals.items():
+            result[column] = values
         
         self.logger.info("Signal generation complete")
         return result
@@ -261,26 +374,25 @@ class SignalGenerator:
         """
         self.logger.info(f"Aggregating signals by {groupby}...")
         
+        # Named aggregations produce flat column names directly
+        agg_spec = {
+            'composite_signal_mean': ('composite_signal', 'mean'),
+            'composite_signal_std': ('composite_signal', 'std'),
+            'composite_signal_count': ('composite_signal', 'count'),
+            'sentiment_signal_mean': ('sentiment_signal', 'mean'),
+            'engagement_score_mean': ('engagement_score', 'mean'),
+            'urgency_signal_mean': ('urgency_signal', 'mean'),
+            'signal_strength_mean': ('signal_strength', 'mean'),
+            'confidence_width_mean': ('confidence_width', 'mean'),
+        }
+        
         if groupby == 'hashtags':
-            # Explode hashtags (one row per hashtag)
-            exploded = signals_df.explode('hashtags')
-            groupby_col = 'hashtags'
+            # One key per hashtag, pointing back at its tweet's row
+            keys, rows = self._explode_keys(signals_df['hashtags'])
         else:
-            exploded = signals_df
-            groupby_col = groupby
-        
-        # Group and aggregate
-        agg_dict = {
-            'composite_signal': ['mean', 'std', 'count'],
-            'sentiment_signal': 'mean',
-            'engagement_score': 'mean',
-            'urgency_signal': 'mean',
-            'signal_strength': 'mean',
-            'confidence_width': 'mean'
-        }
+            keys, rows = signals_df[groupby], None
         
-        aggregated = exploded.groupby(groupby_col).agg(agg_dict)
-        aggregated.columns = ['_'.join(col).strip() for col in aggregated.columns.values]
+        aggregated = self._reduce_groups(signals_df, keys, rows, agg_spec).rename_axis(groupby)
         
         # Filter by minimum tweets
         aggregated = aggregated[aggregated['composite_signal_count'] >= min_tweets]
@@ -289,20 +401,20 @@ class SignalGenerator:
         aggregated['aggregate_confidence'] = 1 - (aggregated['confidence_width_mean'] / 2)
         
         # Determine recommendation
-        def get_recommendation(row):
-            signal = row['composite_signal_mean']
-            strength = abs(signal)
-            confidence = row['aggregate_confidence']
-            
-            if strength > 0.3 and confidence > 0.6:
-                if signal > 0:
-                    return 'STRONG BUY' if strength > 0.6 else 'BUY'
-                else:
-                    return 'STRONG SELL' if strength > 0.6 else 'SELL'
-            else:
-                return 'HOLD'
-        
-        aggregated['recommendation'] = aggregated.apply(get_recommendation, axis=1)
+        signal = aggregated['composite_signal_mean'].to_numpy()
+        strength = np.abs(signal)
+        confident = aggregated['aggregate_confidence'].to_numpy() > 0.6
+        conditions = [
+            (strength > 0.6) & (signal > 0) & confident,
+            (strength > 0.3) & (signal > 0) & confident,
+            (strength > 0.6) & (signal < 0) & confident,
+            (strength > 0.3) & (signal < 0) & confident,
+        ]
+        choices = ['STRONG BUY', 'BUY', 'STRONG SELL', 'SELL']
+        aggregated['recommendation'] = pd.Categorical(
+            np.select(conditions, choices, default='HOLD'),
+            categories=choices + ['HOLD']
+        )
         
         # Sort by signal strength
         aggregated = aggregated.sort_values('composite_signal_mean', ascending=False)
@@ -310,6 +422,91 @@ class SignalGenerator:
         self.logger.info(f"Aggregated {len(aggregated)} groups")
         return aggregated
     
+    @staticmethod
+    def _explode_keys(values: pd.Series) -> Tuple[pd.Series, Optional[np.ndarray]]:
+        """
+        Flatten a list column into its elements and their row positions.
+        
+        Args:
+            values: Series of lists (object or Arrow list dtype)
+            
+        Returns:
+            Tuple of (flattened elements, row position of each element)
+        """
+        if isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_list(values.dtype.pyarrow_dtype):
+            lists = values.array.__arrow_array__()
+            flat = pc.list_flatten(lists)
+            return pd.Series(pd.arrays.ArrowExtensionArray(flat)), pc.list_parent_indices(lists).to_numpy()
+        
+        cells = values.to_numpy()
+        try:
+            lengths = np.fromiter(map(len, cells), dtype=np.intp, count=len(cells))
+            flat = np.concatenate([np.asarray(cell, dtype=object) for cell in cells]) if len(cells) else cells
+        except (TypeError, ValueError):
+            # Scalars or missing cells: let pandas apply its explode rules
+            exploded = values.reset_index(drop=True).explode()
+            return exploded.reset_index(drop=True), exploded.index.to_numpy()
+        return pd.Series(flat, dtype=object), np.repeat(np.arange(len(cells)), lengths)
+    
+    @staticmethod
+    def _reduce_groups(
+        df: pd.DataFrame,
+        keys: pd.Series,
+        rows: Optional[np.ndarray],
+        agg_spec: Dict[str, Tuple[str, str]]
+    ) -> pd.DataFrame:
+        """
+        Array-level equivalent of a groupby(...).agg(**agg_spec) on df.
+        
+        Keys are factorized once and every column is reduced per group code
+        with weighted np.bincount, so no per-column groupby dispatch or sort
+        is needed. Supports 'mean', 'std' (ddof=1) and 'count', skipping NaNs.
+        
+        Args:
+            df: DataFrame with the value columns
+            keys: Group key per (exploded) row; missing keys are dropped
+            rows: Row position in df of each key, or None if aligned with df
+            agg_spec: Mapping of output column to (input column, aggregation)
+            
+        Returns:
+            Aggregated DataFrame indexed by the sorted group keys
+        """
+        codes, uniques = pd.factorize(keys, sort=True)
+        n_groups = len(uniques)
+        keep = codes >= 0
+        if not keep.all():
+            codes = codes[keep]
+            rows = np.flatnonzero(keep) if rows is None else rows[keep]
+        sizes = np.bincount(codes, minlength=n_groups)
+        
+        stats = {}
+        for column in dict.fromkeys(col for col, _ in agg_spec.values()):
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            if rows is not None:
+                values = values[rows]
+            present = ~np.isnan(values)
+            if present.all():
+                counts = sizes
+            else:
+                counts = np.bincount(codes, weights=present, minlength=n_groups).astype(np.int64)
+                values = np.where(present, values, 0.0)
+            
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+                # Second pass over deviations from the group mean keeps the variance stable
+                deviations = np.where(present, values - means[codes], 0.0)
+                variances = np.bincount(codes, weights=deviations * deviations, minlength=n_groups) / (counts - 1)
+            stats[column] = {
+                'count': counts,
+                'mean': means,
+                'std': np.sqrt(np.where(counts > 1, variances, np.nan)),
+            }
+        
+        return pd.DataFrame(
+            {name: stats[column][func] for name, (column, func) in agg_spec.items()},
+            index=pd.Index(uniques)
+        )
+    
     def generate_trading_report(self, signals_df: pd.DataFrame) -> Dict[str, any]:
         """
         Generate trading report with actionable insights.
@@ -326,20 +523,18 @@ class SignalGenerator:
         avg_signal = signals_df['composite_signal'].mean()
         signal_std = signals_df['composite_signal'].std()
         
+        # Count masks over the raw arrays rather than materializing filtered frames
+        signal = signals_df['composite_signal'].to_numpy(dtype=np.float64, na_value=np.nan)
+        strong = signals_df['signal_strength'].to_numpy(dtype=np.float64, na_value=np.nan) > 0.5
+        
         # Distribution
-        bullish_count = len(signals_df[signals_df['composite_signal'] > 0.2])
-        bearish_count = len(signals_df[signals_df['composite_signal'] < -0.2])
-        neutral_count = len(signals_df) - bullish_count - bearish_count
+        bullish_count = int(np.count_nonzero(signal > 0.2))
+        bearish_count = int(np.count_nonzero(signal < -0.2))
+        neutral_count = len(signal) - bullish_count - bearish_count
         
         # Strong signals
-        strong_bullish = signals_df[
-            (signals_df['composite_signal'] > 0.5) &
-            (signals_df['signal_strength'] > 0.5)
-        ]
-        strong_bearish = signals_df[
-            (signals_df['composite_signal'] < -0.5) &
-            (signals_df['signal_strength'] > 0.5)
-        ]
+        strong_bullish_count = int(np.count_nonzero((signal > 0.5) & strong))
+        strong_bearish_count = int(np.count_nonzero((signal < -0.5) & strong))
         
         # Top hashtags
         hashtag_signals = self.aggregate_signals(signals_df, 'hashtags', min_tweets=3)
@@ -359,8 +554,8 @@ class SignalGenerator:
                 'bearish_pct': float(bearish_count / len(signals_df) * 100)
             },
             'strong_signals': {
-                'strong_bullish_count': len(strong_bullish),
-                'strong_bearish_count': len(strong_bearish)
+                'strong_bullish_count': strong_bullish_count,
+                'strong_bearish_count': strong_bearish_count
             },
             'top_hashtags': hashtag_signals.head(10).to_dict('index') if len(hashtag_signals) > 0 else {}
         }
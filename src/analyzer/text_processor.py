@@ -3,17 +3,41 @@ Text processing and NLP analysis module.
 Implements TF-IDF, feature extraction, and sentiment analysis.
 """
 
+import os
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from textblob import TextBlob
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.utils import murmurhash3_32
+from textblob.en.sentiments import PatternAnalyzer
 
 from ..utils import Logger
 
 
+def _trie_alternation(words) -> str:
+    """Build a regex alternation with shared prefixes factored out, e.g. bull(?:ish)?."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return build(trie)
+
+
 class TextProcessor:
     """Process tweet text for NLP analysis and feature extraction."""
     
@@ -35,9 +59,19 @@ class TextProcessor:
         'quick', 'fast', 'today', 'asap', 'hurry', 'rush'
     }
     
-    # Price-related patterns
-    PRICE_PATTERN = re.compile(r'₹?\s*\d+[,\d]*\.?\d*\s*(?:rs|inr|rupees)?', re.IGNORECASE)
-    PERCENTAGE_PATTERN = re.compile(r'-?\d+\.?\d*\s*%')
+    # Fixed label sets for the categorical feature columns
+    SENTIMENT_LABELS = ['negative', 'neutral', 'positive']
+    MARKET_SENTIMENTS = ['bearish', 'neutral', 'bullish']
+    
+    # Whitespace-delimited occurrences of any market/urgency term, as one prefix-trie
+    # alternation so each position walks a single automaton-like branch structure
+    TERM_PATTERN = re.compile(
+        r'(?<!\S)(?:' + _trie_alternation(BULLISH_TERMS | BEARISH_TERMS | URGENCY_INDICATORS) + r')(?!\S)'
+    )
+    
+    # Price-related patterns (ASCII classes: digits/whitespace skip Unicode category lookups)
+    PRICE_PATTERN = re.compile(r'₹?\s*\d+[,\d]*\.?\d*\s*(?:rs|inr|rupees)?', re.IGNORECASE | re.ASCII)
+    PERCENTAGE_PATTERN = re.compile(r'-?\d+\.?\d*\s*%', re.ASCII)
     
     def __init__(self, config: dict, logger: Logger = None):
         """
@@ -53,6 +87,10 @@ class TextProcessor:
         # Extract analysis configuration
         self.analysis_config = config.get("analysis", {})
         self.text_features_config = self.analysis_config.get("text_features", {})
+        self.performance_config = config.get("performance", {})
+        
+        # TextBlob's default analyzer, reused across tweets instead of one TextBlob per text
+        self._sentiment_analyzer = PatternAnalyzer()
         
         # Initialize TF-IDF vectorizer
         self.tfidf_vectorizer = None
@@ -62,35 +100,64 @@ class TextProcessor:
         self.logger.info("TextProcessor initialized")
     
     def _initialize_tfidf(self):
-        """Initialize TF-IDF vectorizer."""
-        max_features = self.text_features_config.get("max_features", 1000)
+        """Initialize hashed TF-IDF pipeline."""
+        n_features = self.text_features_config.get("hash_features", 2 ** 18)
         ngram_range = tuple(self.text_features_config.get("ngram_range", [1, 2]))
         
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            ngram_range=ngram_range,
-            stop_words='english',
-            lowercase=True,
-            strip_accents='unicode',
-            token_pattern=r'\b[a-zA-Z]{2,}\b'
-        )
+        # Stateless hashing replaces vocabulary construction; raw counts feed the IDF step
+        self.tfidf_vectorizer = Pipeline([
+            ('hash', HashingVectorizer(
+                n_features=n_features,
+                ngram_range=ngram_range,
+                stop_words='english',
+                lowercase=True,
+                strip_accents='unicode',
+                token_pattern=r'\b[a-zA-Z]{2,}\b',
+                alternate_sign=False,
+                norm=None
+            )),
+            ('tfidf', TfidfTransformer())
+        ])
         
-        self.logger.info(f"TF-IDF initialized: max_features={max_features}, ngram_range={ngram_range}")
+        self.logger.info(f"TF-IDF initialized: n_features={n_features}, ngram_range={ngram_range}")
     
     def extract_sentiment(self, text: str) -> Dict[str, float]:
         """Extract sentiment from text using TextBlob."""
         try:
-            blob = TextBlob(text)
+            sentiment = self._sentiment_analyzer.analyze(text)
             
             return {
-                'polarity': blob.sentiment.polarity,  # -1 to 1
-                'subjectivity': blob.sentiment.subjectivity,  # 0 to 1
-                'sentiment_label': self._get_sentiment_label(blob.sentiment.polarity)
+                'polarity': sentiment.polarity,  # -1 to 1
+                'subjectivity': sentiment.subjectivity,  # 0 to 1
+                'sentiment_label': self._get_sentiment_label(sentiment.polarity)
             }
         except Exception as e:
             self.logger.debug(f"Error extracting sentiment: {e}")
             return {'polarity': 0.0, 'subjectivity': 0.0, 'sentiment_label': 'neutral'}
     
+    def extract_sentiment_batch(self, texts: pd.Series) -> pd.DataFrame:
+        """Extract sentiment for a Series of texts, scoring each distinct text once."""
+        codes, uniques = pd.factorize(texts)
+        polarity = np.empty(len(uniques), dtype=np.float64)
+        subjectivity = np.empty(len(uniques), dtype=np.float64)
+        
+        for i, text in enumerate(uniques):
+            try:
+                polarity[i], subjectivity[i] = self._sentiment_analyzer.analyze(text)
+            except Exception as e:
+                self.logger.debug(f"Error extracting sentiment: {e}")
+                polarity[i], subjectivity[i] = 0.0, 0.0
+        
+        polarity = polarity[codes]
+        return pd.DataFrame({
+            'polarity': polarity,
+            'subjectivity': subjectivity[codes],
+            'sentiment_label': pd.Categorical.from_codes(
+                np.select([polarity > 0.1, polarity < -0.1], [2, 0], default=1).astype(np.int8),
+                categories=self.SENTIMENT_LABELS
+            )
+        }, index=texts.index)
+    
     @staticmethod
     def _get_sentiment_label(polarity: float) -> str:
         """Convert polarity to label."""
@@ -176,51 +243,165 @@ class TextProcessor:
         return features
     
     def process_tweets(self, tweets: pd.DataFrame) -> pd.DataFrame:
-        """Process a batch of tweets and extract features."""
-        self.logger.info(f"Processing {len(tweets)} tweets for feature extraction...")
+        """Process a batch of tweets and extract features. The result shares column data with tweets."""
+        n_rows = len(tweets.index)
+        self.logger.info(f"Processing {n_rows} tweets for feature extraction...")
+        
+        if 'content' in tweets.columns:
+            texts = tweets['content'].astype(str).reset_index(drop=True)
+        else:
+            texts = pd.Series([''] * n_rows, dtype=object)
         
-        features_list = []
-        for idx, row in tweets.iterrows():
-            text = row.get('content', '')
-            features = self.extract_all_features(text)
-            features_list.append(features)
+        n_jobs = min(self.performance_config.get("max_workers", 1), os.cpu_count() or 1)
+        chunk_size = self.performance_config.get("chunk_size", 1000)
+        
+        if n_jobs > 1 and n_rows > chunk_size:
+            # Feature extraction is CPU-bound Python; only text chunks and their features cross processes
+            chunks = [texts.iloc[start:start + chunk_size] for start in range(0, n_rows, chunk_size)]
+            self.logger.info(f"Extracting features in {len(chunks)} chunks with n_jobs={n_jobs}")
+            parts = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(self._extract_text_features)(chunk) for chunk in chunks
+            )
+            features = pd.concat(parts)
+        else:
+            features = self._extract_text_features(texts)
         
-        features_df = pd.DataFrame(features_list)
-        result = pd.concat([tweets.reset_index(drop=True), features_df], axis=1)
+        # Feature columns are attached to a shallow copy; concatenating would copy every tweet column
+        result = tweets.set_axis(pd.RangeIndex(n_rows), copy=False)
+        for column, values in features.items():
+            result[column] = values
         
         self.logger.info("Feature extraction complete")
         return result
     
-    def fit_tfidf(self, texts: List[str]) -> TfidfVectorizer:
-        """Fit TF-IDF vectorizer on texts."""
+    def _count_term_matches(self, matches: pd.Series, terms: set, n_rows: int) -> np.ndarray:
+        """Count matched terms per row that belong to a term set."""
+        rows = matches.index[matches.isin(terms)]
+        return np.bincount(rows.to_numpy(dtype=np.intp), minlength=n_rows)
+    
+    def _extract_text_features(self, texts: pd.Series) -> pd.DataFrame:
+        """
+        Extract features for a Series of tweet texts, keeping its index.
+        
+        Column-wise equivalent of extract_all_features; TextBlob sentiment
+        is evaluated once per distinct text.
+        """
+        index = texts.index
+        texts = texts.reset_index(drop=True)
+        n_rows = len(texts)
+        
+        features = self.extract_sentiment_batch(texts)
+        
+        # One regex scan per tweet; distinct matches mirror the set intersections in extract_market_sentiment
+        matches = texts.str.lower().str.findall(self.TERM_PATTERN).explode().dropna()
+        matches = matches[~pd.MultiIndex.from_arrays([matches.index, matches.to_numpy()]).duplicated()]
+        bullish_count = self._count_term_matches(matches, self.BULLISH_TERMS, n_rows)
+        bearish_count = self._count_term_matches(matches, self.BEARISH_TERMS, n_rows)
+        urgency_count = self._count_term_matches(matches, self.URGENCY_INDICATORS, n_rows)
+        
+        total = bullish_count + bearish_count
+        has_terms = total > 0
+        bullish_ratio = np.divide(bullish_count, total, out=np.full(n_rows, 0.5), where=has_terms)
+        bearish_ratio = np.divide(bearish_count, total, out=np.full(n_rows, 0.5), where=has_terms)
+        more_bullish = bullish_count > bearish_count
+        more_bearish = bearish_count > bullish_count
+        
+        features['market_sentiment'] = pd.Categorical.from_codes(
+            np.select([more_bullish, more_bearish], [2, 0], default=1).astype(np.int8),
+            categories=self.MARKET_SENTIMENTS
+        )
+        features['bullish_score'] = bullish_ratio
+        features['bearish_score'] = bearish_ratio
+        features['confidence'] = np.select([more_bullish, more_bearish], [bullish_ratio, bearish_ratio], default=0.5)
+        features['bullish_terms_count'] = bullish_count
+        features['bearish_terms_count'] = bearish_count
+        
+        exclamation_count = texts.str.count('!').to_numpy()
+        features['urgency_score'] = np.minimum(1.0, (urgency_count * 0.2) + (exclamation_count * 0.1))
+        
+        words = texts.str.split()
+        prices = texts.str.findall(self.PRICE_PATTERN)
+        percentages = texts.str.findall(self.PERCENTAGE_PATTERN)
+        price_count = prices.str.len()
+        percentage_count = percentages.str.len()
+        features['has_price'] = price_count > 0
+        features['price_count'] = price_count
+        features['prices'] = prices
+        features['has_percentage'] = percentage_count > 0
+        features['percentage_count'] = percentage_count
+        features['percentages'] = percentages
+        
+        word_count = words.str.len().to_numpy()
+        char_count = texts.str.len().to_numpy()
+        features['word_count'] = word_count
+        features['char_count'] = char_count
+        features['avg_word_length'] = np.divide(
+            char_count, word_count, out=np.zeros(n_rows), where=word_count > 0
+        )
+        
+        return features.set_axis(index, copy=False)
+    
+    def fit_tfidf(self, texts: Union[List[str], pd.Series]) -> Pipeline:
+        """Fit TF-IDF pipeline on texts."""
         if self.tfidf_vectorizer is None:
             self._initialize_tfidf()
         
         self.logger.info(f"Fitting TF-IDF on {len(texts)} documents...")
         self.tfidf_vectorizer.fit(texts)
-        self.logger.info(f"TF-IDF fitted. Vocabulary size: {len(self.tfidf_vectorizer.vocabulary_)}")
+        self.logger.info(f"TF-IDF fitted. Hashed feature space: {self.tfidf_vectorizer.named_steps['hash'].n_features}")
         
         return self.tfidf_vectorizer
     
-    def transform_tfidf(self, texts: List[str]) -> Tuple[np.ndarray, List[str]]:
-        """Transform texts to TF-IDF features."""
-        if self.tfidf_vectorizer is None:
+    def _is_tfidf_fitted(self) -> bool:
+        """Check whether the IDF weights have been learned."""
+        return self.tfidf_vectorizer is not None and hasattr(self.tfidf_vectorizer.named_steps['tfidf'], 'idf_')
+    
+    def transform_tfidf(self, texts: Union[List[str], pd.Series]) -> sparse.csr_matrix:
+        """Transform texts to hashed TF-IDF features."""
+        if not self._is_tfidf_fitted():
             raise ValueError("TF-IDF vectorizer not fitted. Call fit_tfidf first.")
         
-        tfidf_matrix = self.tfidf_vectorizer.transform(texts)
-        feature_names = self.tfidf_vectorizer.get_feature_names_out()
+        return self.tfidf_vectorizer.transform(texts)
+    
+    def _resolve_hashed_terms(
+        self,
+        texts: Union[List[str], pd.Series],
+        tfidf_matrix: sparse.csr_matrix,
+        buckets: np.ndarray
+    ) -> Dict[int, str]:
+        """Map hashed feature columns back to terms using only the documents that hit them."""
+        hashing = self.tfidf_vectorizer.named_steps['hash']
+        analyzer = hashing.build_analyzer()
+        wanted = set(buckets.tolist())
+        
+        rows = np.unique(tfidf_matrix[:, buckets].nonzero()[0])
+        candidate_texts = texts.iloc[rows] if isinstance(texts, pd.Series) else [texts[row] for row in rows]
         
-        return tfidf_matrix, feature_names
+        bucket_terms = {}
+        for text in candidate_texts:
+            for term in analyzer(text):
+                bucket = abs(murmurhash3_32(term, seed=0)) % hashing.n_features
+                if bucket in wanted and bucket not in bucket_terms:
+                    bucket_terms[bucket] = term
+            if len(bucket_terms) == len(wanted):
+                break
+        
+        return bucket_terms
     
-    def get_top_terms(self, texts: List[str], top_n: int = 20) -> List[Tuple[str, float]]:
-        """Get top terms by TF-IDF score."""
-        if self.tfidf_vectorizer is None:
+    def get_top_terms(self, texts: Union[List[str], pd.Series], top_n: int = 20) -> List[Tuple[str, float]]:
+        """Get top terms by TF-IDF score. Accepts a list or a Series without copying it."""
+        if not self._is_tfidf_fitted():
             self.fit_tfidf(texts)
         
-        tfidf_matrix, feature_names = self.transform_tfidf(texts)
-        mean_scores = tfidf_matrix.mean(axis=0).A1
+        tfidf_matrix = self.transform_tfidf(texts)
+        mean_scores = np.asarray(tfidf_matrix.sum(axis=0)).ravel() / tfidf_matrix.shape[0]
         
-        top_indices = mean_scores.argsort()[-top_n:][::-1]
-        top_terms = [(feature_names[i], mean_scores[i]) for i in top_indices]
+        # Partial selection of the top_n buckets, then order just those (ties by bucket index)
+        top_n = min(top_n, len(mean_scores))
+        top_indices = np.argpartition(mean_scores, -top_n)[-top_n:] if top_n > 0 else np.array([], dtype=np.intp)
+        top_indices = top_indices[np.lexsort((top_indices, -mean_scores[top_indices]))]
+        top_indices = top_indices[mean_scores[top_indices] > 0]
+        bucket_terms = self._resolve_hashed_terms(texts, tfidf_matrix, top_indices)
+        top_terms = [(bucket_terms[i], mean_scores[i]) for i in top_indices if i in bucket_terms]
         
         return top_terms
@@ -4,15 +4,17 @@ Creates charts and graphs for signal analysis and market trends.
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for memory efficiency
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import pyarrow as pa
 import seaborn as sns
 
 from ..utils import Logger
@@ -21,6 +23,29 @@ from ..utils import Logger
 class Visualizer:
     """Create visualizations for tweet analysis and trading signals."""
     
+    # Signal columns read by the plotting methods
+    REQUIRED_COLUMNS = [
+        'timestamp', 'content', 'polarity', 'sentiment_label', 'market_sentiment',
+        'composite_signal', 'signal_strength', 'signal_direction',
+        'engagement_score', 'urgency_signal',
+    ]
+    
+    # Label columns summarized with value counts
+    LABEL_COLUMNS = ['sentiment_label', 'market_sentiment', 'signal_direction']
+    
+    # Arrow-backed float dtypes, as read with dtype_backend='pyarrow'
+    ARROW_FLOAT64 = pd.ArrowDtype(pa.float64())
+    ARROW_FLOAT32 = pd.ArrowDtype(pa.float32())
+    
+    # Grid (x, y) for density plots, roughly 5x5 pixels per cell at 100 dpi
+    DENSITY_BINS = (120, 80)
+    
+    # Rows painted into density grids per batch
+    DENSITY_BATCH_ROWS = 65536
+    
+    # Maximum points per line trace written to the interactive dashboard
+    DASHBOARD_MAX_POINTS = 5000
+    
     def __init__(self, config: dict, logger: Logger = None):
         """
         Initialize visualizer.
@@ -39,6 +64,106 @@ class Visualizer:
         
         self.logger.info("Visualizer initialized")
     
+    @staticmethod
+    def _save_figure(output_path):
+        """
+        Save the current figure at 100 dpi.
+        
+        The figure is laid out with tight_layout beforehand, so no tight
+        bounding box pass is needed at save time. JPEG output is encoded at
+        quality 85.
+        """
+        pil_kwargs = {'quality': 85} if Path(output_path).suffix.lower() in ('.jpg', '.jpeg') else None
+        plt.savefig(output_path, dpi=100, pil_kwargs=pil_kwargs)
+    
+    @classmethod
+    def _compact_dtypes(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Narrow columns for plotting without modifying the caller's frame.
+        
+        Label columns are counted by several plots, so object labels become
+        categoricals counted on codes; float64 columns become float32, which
+        halves the data histogrammed and aggregated with no visible change.
+        
+        Args:
+            df: DataFrame to plot
+            
+        Returns:
+            DataFrame with compact dtypes
+        """
+        dtypes = {}
+        for column, dtype in df.dtypes.items():
+            if column in cls.LABEL_COLUMNS and dtype == object:
+                dtypes[column] = 'category'
+            elif dtype == np.float64:
+                dtypes[column] = np.float32
+            elif dtype == cls.ARROW_FLOAT64:
+                dtypes[column] = cls.ARROW_FLOAT32
+        
+        return df.astype(dtypes, copy=False) if dtypes else df
+    
+    @staticmethod
+    def _label_counts(labels: pd.Series) -> pd.Series:
+        """Count label values, leaving out unobserved categorical labels."""
+        counts = labels.value_counts()
+        return counts[counts > 0]
+    
+    @classmethod
+    def _binned_mean_image(
+        cls,
+        df: pd.DataFrame,
+        x: str,
+        y: str,
+        value: str
+    ) -> Tuple[np.ndarray, List[float]]:
+        """
+        Aggregate points onto a fixed grid, averaging a value per cell.
+        
+        Rows are painted into the grid one batch at a time, so memory beyond
+        the DataFrame itself is bounded by the batch and grid sizes and every
+        row can be plotted without sampling.
+        
+        Args:
+            df: DataFrame with the columns to plot
+            x: X coordinate column
+            y: Y coordinate column
+            value: Column to average in each cell
+            
+        Returns:
+            Tuple of (image with NaN for empty cells, imshow extent)
+        """
+        x_edges = cls._bin_edges(df[x], cls.DENSITY_BINS[0])
+        y_edges = cls._bin_edges(df[y], cls.DENSITY_BINS[1])
+        
+        counts = np.zeros(cls.DENSITY_BINS)
+        sums = np.zeros(cls.DENSITY_BINS)
+        for start in range(0, len(df), cls.DENSITY_BATCH_ROWS):
+            batch = df.iloc[start:start + cls.DENSITY_BATCH_ROWS]
+            bx = batch[x].to_numpy(dtype=np.float64, na_value=np.nan)
+            by = batch[y].to_numpy(dtype=np.float64, na_value=np.nan)
+            bv = batch[value].to_numpy(dtype=np.float64, na_value=np.nan)
+            
+            finite = np.isfinite(bx) & np.isfinite(by) & np.isfinite(bv)
+            bx, by, bv = bx[finite], by[finite], bv[finite]
+            
+            counts += np.histogram2d(bx, by, bins=[x_edges, y_edges])[0]
+            sums += np.histogram2d(bx, by, bins=[x_edges, y_edges], weights=bv)[0]
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            image = (sums / counts).T
+        
+        return image, [x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]]
+    
+    @staticmethod
+    def _bin_edges(values: pd.Series, bins: int) -> np.ndarray:
+        """Evenly spaced bin edges over the finite range of a column."""
+        low, high = values.min(), values.max()
+        if pd.isna(low) or pd.isna(high):
+            low, high = 0.0, 1.0
+        elif low == high:
+            low, high = low - 0.5, high + 0.5
+        return np.linspace(float(low), float(high), bins + 1)
+    
     def plot_sentiment_distribution(
         self,
         df: pd.DataFrame,
@@ -70,7 +195,7 @@ class Visualizer:
         axes[0].axvline(x=0, color='red', linestyle='--', linewidth=1)
         
         # Market sentiment
-        market_sentiment_counts = df['market_sentiment'].value_counts()
+        market_sentiment_counts = self._label_counts(df['market_sentiment'])
         axes[1].bar(market_sentiment_counts.index, market_sentiment_counts.values, alpha=0.7)
         axes[1].set_xlabel('Market Sentiment')
         axes[1].set_ylabel('Count')
@@ -78,7 +203,7 @@ class Visualizer:
         axes[1].tick_params(axis='x', rotation=45)
         
         # Sentiment label
-        sentiment_counts = df['sentiment_label'].value_counts()
+        sentiment_counts = self._label_counts(df['sentiment_label'])
         axes[2].pie(
             sentiment_counts.values,
             labels=sentiment_counts.index,
@@ -90,7 +215,7 @@ class Visualizer:
         plt.tight_layout()
         
         if output_path:
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
+            self._save_figure(output_path)
             self.logger.info(f"Sentiment distribution saved to {output_path}")
         
         plt.close()
@@ -123,21 +248,15 @@ class Visualizer:
         axes[0, 1].set_title('Signal Strength Distribution')
         
         # Signal direction
-        signal_dir_counts = df['signal_direction'].value_counts()
+        signal_dir_counts = self._label_counts(df['signal_direction'])
         axes[1, 0].bar(signal_dir_counts.index, signal_dir_counts.values, alpha=0.7, color=['green', 'red'])
         axes[1, 0].set_xlabel('Signal Direction')
         axes[1, 0].set_ylabel('Count')
         axes[1, 0].set_title('Bullish vs Bearish Signals')
         
-        # Scatter: engagement vs signal
-        scatter_sample = df.sample(n=min(500, len(df)), random_state=42)
-        axes[1, 1].scatter(
-            scatter_sample['engagement_score'],
-            scatter_sample['composite_signal'],
-            alpha=0.5,
-            c=scatter_sample['signal_strength'],
-            cmap='viridis'
-        )
+        # Density: engagement vs signal, colored by mean strength per bin
+        image, extent = self._binned_mean_image(df, 'engagement_score', 'composite_signal', 'signal_strength')
+        axes[1, 1].imshow(image, extent=extent, origin='lower', aspect='auto', cmap='viridis')
         axes[1, 1].set_xlabel('Engagement Score')
         axes[1, 1].set_ylabel('Composite Signal')
         axes[1, 1].set_title('Engagement vs Signal')
@@ -146,7 +265,7 @@ class Visualizer:
         plt.tight_layout()
         
         if output_path:
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
+            self._save_figure(output_path)
             self.logger.info(f"Signal strength plot saved to {output_path}")
         
         plt.close()
@@ -167,15 +286,11 @@ class Visualizer:
         """
         # Convert timestamp to datetime
         df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values('timestamp')
         
         # Resample for memory efficiency
-        df_resampled = df.set_index('timestamp').resample(resample_freq).agg({
-            'composite_signal': 'mean',
-            'engagement_score': 'mean',
-            'urgency_signal': 'mean',
-            'polarity': 'mean'
-        }).reset_index()
+        df_resampled = self._resample_means(
+            df, ['composite_signal', 'engagement_score', 'urgency_signal', 'polarity'], resample_freq
+        )
         
         fig, axes = plt.subplots(2, 1, figsize=(14, 8))
         
@@ -219,11 +334,55 @@ class Visualizer:
         plt.tight_layout()
         
         if output_path:
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
+            self._save_figure(output_path)
             self.logger.info(f"Time series plot saved to {output_path}")
         
         plt.close()
     
+    @staticmethod
+    def _resample_means(df: pd.DataFrame, columns: List[str], freq: str) -> pd.DataFrame:
+        """
+        Mean of columns per fixed time bin, like resample(freq).mean().
+        
+        Bins start at midnight of the first day (resample's default origin)
+        and rows are assigned to them by integer division, so the means are
+        two bincounts per column instead of a groupby.
+        
+        Args:
+            df: DataFrame with a datetime 'timestamp' column
+            columns: Columns to average
+            freq: Bin width as a fixed frequency string (e.g. '1H')
+            
+        Returns:
+            DataFrame with 'timestamp' bin labels and one mean column each;
+            bins without values are NaN
+        """
+        timestamps = df['timestamp']
+        has_time = timestamps.notna().to_numpy()
+        if not has_time.any():
+            return pd.DataFrame(columns=['timestamp', *columns])
+        
+        origin = timestamps.min().normalize()
+        freq_ns = pd.Timedelta(freq).value
+        offsets = (timestamps[has_time] - origin).to_numpy(dtype='timedelta64[ns]').astype(np.int64)
+        bins = offsets // freq_ns
+        first_bin = bins.min()
+        bins -= first_bin
+        n_bins = int(bins.max()) + 1
+        
+        resampled = {
+            'timestamp': origin + pd.to_timedelta((first_bin + np.arange(n_bins)) * freq_ns, unit='ns')
+        }
+        for column in columns:
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)[has_time]
+            valid = ~np.isnan(values)
+            sums = np.bincount(bins[valid], weights=values[valid], minlength=n_bins)
+            counts = np.bincount(bins[valid], minlength=n_bins)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                resampled[column] = sums / counts
+        
+        return pd.DataFrame(resampled)
+    
     def plot_hashtag_signals(
         self,
         aggregated_df: pd.DataFrame,
@@ -280,7 +439,7 @@ class Visualizer:
         plt.tight_layout()
         
         if output_path:
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
+            self._save_figure(output_path)
             self.logger.info(f"Hashtag signals plot saved to {output_path}")
         
         plt.close()
@@ -310,19 +469,27 @@ class Visualizer:
                 'Signal Strength Over Time'
             ),
             specs=[
-                [{'type': 'histogram'}, {'type': 'bar'}],
+                [{'type': 'bar'}, {'type': 'bar'}],
                 [{'type': 'scatter'}, {'type': 'scatter'}]
             ]
         )
         
-        # Signal distribution
+        # Signal distribution, binned here so only bin counts are embedded
+        signal = df['composite_signal'].to_numpy(dtype=np.float64, na_value=np.nan)
+        counts, edges = np.histogram(signal[np.isfinite(signal)], bins=40)
         fig.add_trace(
-            go.Histogram(x=df['composite_signal'], name='Signal', marker_color='steelblue'),
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                name='Signal',
+                marker_color='steelblue'
+            ),
             row=1, col=1
         )
         
         # Market sentiment
-        sentiment_counts = df['market_sentiment'].value_counts()
+        sentiment_counts = self._label_counts(df['market_sentiment'])
         fig.add_trace(
             go.Bar(x=sentiment_counts.index, y=sentiment_counts.values, name='Sentiment'),
             row=1, col=2
@@ -346,12 +513,14 @@ class Visualizer:
             row=2, col=1
         )
         
-        # Time series
-        df_sorted = df.sort_values('timestamp')
+        # Time series, thinned to at most DASHBOARD_MAX_POINTS after smoothing
+        df_sorted = df[['timestamp', 'composite_signal']].sort_values('timestamp')
+        moving_average = df_sorted['composite_signal'].rolling(window=50).mean()
+        step = max(1, -(-len(df_sorted) // self.DASHBOARD_MAX_POINTS))
         fig.add_trace(
             go.Scatter(
-                x=df_sorted['timestamp'],
-                y=df_sorted['composite_signal'].rolling(window=50).mean(),
+                x=df_sorted['timestamp'].to_numpy()[::step],
+                y=moving_average.to_numpy(dtype=np.float64, na_value=np.nan)[::step],
                 mode='lines',
                 name='Signal (MA50)',
                 line=dict(color='blue', width=2)
@@ -390,6 +559,9 @@ class Visualizer:
         
         self.logger.info("Generating all visualizations...")
         
+        df = self._compact_dtypes(df)
+        aggregated_df = self._compact_dtypes(aggregated_df)
+        
         # Static plots
         self.plot_sentiment_distribution(df, output_path / "sentiment_distribution.png")
         self.plot_signal_strength(df, output_path / "signal_strength.png")
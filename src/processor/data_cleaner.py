@@ -3,18 +3,25 @@ Data cleaning and normalization module.
 Handles text cleaning, Unicode processing, and data validation.
 """
 
+import os
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 import unicodedata
 
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
 from ..utils import Logger, is_valid_tweet_content
 
 
 class DataCleaner:
     """Clean and normalize tweet data."""
     
-    # URL pattern
-    URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+    # URL pattern; one character class per URL character, so the scan
+    # never backtracks between alternatives (%XX escapes are in $-_)
+    URL_PATTERN = re.compile(r'http[s]?://[a-zA-Z0-9$-_@.&+!*\\(\\),]+')
     
     # Mention pattern (@username)
     MENTION_PATTERN = re.compile(r'@[\w]+')
@@ -22,6 +29,33 @@ class DataCleaner:
     # Hashtag pattern (#hashtag)
     HASHTAG_PATTERN = re.compile(r'#[\w]+')
     
+    # Emoji pattern (basic)
+    EMOJI_PATTERN = re.compile(
+        "["
+        u"\U0001F600-\U0001F64F"  # emoticons
+        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+        u"\U0001F680-\U0001F6FF"  # transport & map symbols
+        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+        u"\U00002702-\U000027B0"
+        u"\U000024C2-\U0001F251"
+        "]+",
+        flags=re.UNICODE
+    )
+    
+    # Emoji -> description table for single-code-point emojis
+    EMOJI_TRANSLATION = str.maketrans({
+        '🚀': ' rocket ',
+        '📈': ' chart_increasing ',
+        '📉': ' chart_decreasing ',
+        '💰': ' money ',
+        '🔥': ' fire ',
+        '👍': ' thumbs_up ',
+        '👎': ' thumbs_down ',
+    })
+    
+    # Warning sign with emoji variation selector (U+26A0 U+FE0F)
+    WARNING_EMOJI = '\u26a0\ufe0f'
+    
     # Extra whitespace pattern
     WHITESPACE_PATTERN = re.compile(r'\s+')
     
@@ -39,6 +73,7 @@ class DataCleaner:
         # Extract cleaning configuration
         self.cleaning_config = config.get("processor", {}).get("cleaning", {})
         self.normalization_config = config.get("processor", {}).get("normalization", {})
+        self.performance_config = config.get("performance", {})
         
         self.logger.info("DataCleaner initialized")
     
@@ -87,23 +122,12 @@ class DataCleaner:
         
         cleaned = text
         
-        # Remove URLs if configured
-        if self.normalization_config.get("remove_urls", True):
-            cleaned = self.URL_PATTERN.sub('', cleaned)
-        
-        # Remove mentions if configured
-        if self.normalization_config.get("remove_mentions", False):
-            cleaned = self.MENTION_PATTERN.sub('', cleaned)
+        # Remove URLs, then mentions, hashtags and emojis in one pass, as configured
+        for removal_pattern in self._get_removal_patterns():
+            cleaned = removal_pattern.sub('', cleaned)
         
-        # Remove hashtags if configured
-        if self.normalization_config.get("remove_hashtags", False):
-            cleaned = self.HASHTAG_PATTERN.sub('', cleaned)
-        
-        # Handle emojis
-        emoji_handling = self.normalization_config.get("handle_emojis", "keep")
-        if emoji_handling == "remove":
-            cleaned = self._remove_emojis(cleaned)
-        elif emoji_handling == "replace":
+        # Replace emojis if configured
+        if self.normalization_config.get("handle_emojis", "keep") == "replace":
             cleaned = self._replace_emojis(cleaned)
         
         # Normalize whitespace
@@ -118,6 +142,56 @@ class DataCleaner:
         
         return cleaned
     
+    def _get_removal_patterns(self) -> Tuple[re.Pattern, ...]:
+        """
+        Get the removal patterns for the current configuration.
+        
+        Returns:
+            Compiled patterns to apply in order (empty if nothing is removed)
+        """
+        return self._build_removal_patterns(
+            self.normalization_config.get("remove_urls", True),
+            self.normalization_config.get("remove_mentions", False),
+            self.normalization_config.get("remove_hashtags", False),
+            self.normalization_config.get("handle_emojis", "keep") == "remove",
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _build_removal_patterns(cls, remove_urls: bool, remove_mentions: bool,
+                                remove_hashtags: bool, remove_emojis: bool) -> Tuple[re.Pattern, ...]:
+        """
+        Compile the enabled removal patterns.
+        
+        URLs are removed in a pass of their own first: in a single
+        alternation a mention or hashtag directly before a URL would match
+        into it (e.g. '@abchttp') and leave the rest of the URL behind.
+        Mentions, hashtags and emojis are combined into one alternation.
+        
+        Args:
+            remove_urls: Remove URLs
+            remove_mentions: Remove @mentions
+            remove_hashtags: Remove #hashtags
+            remove_emojis: Remove emojis
+            
+        Returns:
+            Compiled patterns to apply in order (empty if nothing is removed)
+        """
+        patterns = [cls.URL_PATTERN] if remove_urls else []
+        
+        enabled = [
+            pattern.pattern
+            for pattern, flag in (
+                (cls.MENTION_PATTERN, remove_mentions),
+                (cls.HASHTAG_PATTERN, remove_hashtags),
+                (cls.EMOJI_PATTERN, remove_emojis),
+            )
+            if flag
+        ]
+        if enabled:
+            patterns.append(re.compile('|'.join(f'(?:{pattern})' for pattern in enabled)))
+        return tuple(patterns)
+    
     def _handle_unicode(self, tweet: Dict) -> Dict:
         """
         Handle Unicode characters in tweet data.
@@ -129,12 +203,31 @@ class DataCleaner:
             Tweet with normalized Unicode
         """
         for key, value in tweet.items():
-            if isinstance(value, str):
+            if isinstance(value, str) and not unicodedata.is_normalized('NFC', value):
                 # Normalize Unicode (NFD -> NFC)
                 tweet[key] = unicodedata.normalize('NFC', value)
         
         return tweet
     
+    @staticmethod
+    def _normalize_series(values: pd.Series) -> pd.Series:
+        """
+        NFC-normalize the strings in a Series, leaving other values as-is.
+        
+        Args:
+            values: Series of values
+            
+        Returns:
+            Series with normalized Unicode
+        """
+        needs_normalizing = values.map(
+            lambda v: isinstance(v, str) and not unicodedata.is_normalized('NFC', v)
+        ).astype(bool)
+        if not needs_normalizing.any():
+            return values
+        
+        return values.mask(needs_normalizing, values[needs_normalizing].str.normalize('NFC'))
+    
     def _remove_emojis(self, text: str) -> str:
         """
         Remove emoji characters from text.
@@ -145,19 +238,7 @@ class DataCleaner:
         Returns:
             Text without emojis
         """
-        # Emoji pattern (basic)
-        emoji_pattern = re.compile(
-            "["
-            u"\U0001F600-\U0001F64F"  # emoticons
-            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-            u"\U0001F680-\U0001F6FF"  # transport & map symbols
-            u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            u"\U00002702-\U000027B0"
-            u"\U000024C2-\U0001F251"
-            "]+",
-            flags=re.UNICODE
-        )
-        return emoji_pattern.sub('', text)
+        return self.EMOJI_PATTERN.sub('', text)
     
     def _replace_emojis(self, text: str) -> str:
         """
@@ -169,22 +250,9 @@ class DataCleaner:
         Returns:
             Text with emojis replaced
         """
-        # Simple replacement - could be enhanced with emoji library
-        emoji_map = {
-            '🚀': ' rocket ',
-            '📈': ' chart_increasing ',
-            '📉': ' chart_decreasing ',
-            '💰': ' money ',
-            '🔥': ' fire ',
-            '👍': ' thumbs_up ',
-            '👎': ' thumbs_down ',
-            '⚠️': ' warning ',
-        }
-        
-        for emoji, replacement in emoji_map.items():
-            text = text.replace(emoji, replacement)
-        
-        return text
+        # Simple replacement - could be enhanced with emoji library.
+        # The warning sign is two code points, so it can't go in the table.
+        return text.replace(self.WARNING_EMOJI, ' warning ').translate(self.EMOJI_TRANSLATION)
     
     def filter_retweets(self, tweets: List[Dict]) -> List[Dict]:
         """
@@ -227,6 +295,9 @@ class DataCleaner:
         """
         Clean a batch of tweets.
         
+        Contents are cleaned and filtered column-wise in one pass per
+        transform; tweet dictionaries are only rebuilt for kept tweets.
+        
         Args:
             tweets: List of tweet dictionaries
             
@@ -235,18 +306,130 @@ class DataCleaner:
         """
         self.logger.info(f"Cleaning {len(tweets)} tweets...")
         
+        has_content = [('content' in tweet) for tweet in tweets]
+        content = self._clean_content(pd.Series(
+            [tweet.get('content', '') for tweet in tweets], dtype=object
+        ))
+        lengths = content.str.len().to_numpy()
+        
+        handle_unicode = self.cleaning_config.get("handle_unicode", True)
+        if handle_unicode:
+            content = self._normalize_series(content)
+        
+        # Validate content length and filter retweets with a single mask
+        min_length = self.cleaning_config.get("min_content_length", 10)
+        keep = lengths >= min_length
+        if self.cleaning_config.get("remove_retweets", True):
+            is_retweet = content.str.startswith('RT @').to_numpy(dtype=bool)
+            self.logger.info(f"Filtered retweets: {len(tweets)} -> {len(tweets) - int(is_retweet.sum())}")
+            keep &= ~is_retweet
+        
         cleaned = []
-        for tweet in tweets:
-            try:
-                cleaned_tweet = self.clean_tweet(tweet)
-                cleaned.append(cleaned_tweet)
-            except Exception as e:
-                self.logger.error(f"Error cleaning tweet: {e}")
-                continue
+        for i in np.flatnonzero(keep):
+            tweet = tweets[i]
+            cleaned_tweet = self._handle_unicode(tweet.copy()) if handle_unicode else tweet.copy()
+            if has_content[i]:
+                cleaned_tweet['content'] = content.iat[i]
+                cleaned_tweet['content_length'] = int(lengths[i])
+            cleaned_tweet['is_valid'] = True
+            cleaned.append(cleaned_tweet)
+        
+        self.logger.info(f"Cleaning complete: {len(cleaned)} tweets")
+        return cleaned
+    
+    def _clean_content(self, content: pd.Series) -> pd.Series:
+        """
+        Vectorized equivalent of clean_text over a Series of contents.
+        
+        Large inputs are cleaned in chunks across worker processes when
+        performance.max_workers allows it.
+        
+        Args:
+            content: Series of raw texts; non-string values are treated as empty
+            
+        Returns:
+            Series of cleaned texts
+        """
+        n_rows = len(content.index)
+        n_jobs = min(self.performance_config.get("max_workers", 1), os.cpu_count() or 1)
+        chunk_size = self.performance_config.get("chunk_size", 1000)
+        
+        if n_jobs > 1 and n_rows > chunk_size:
+            # Only text chunks cross processes; results keep the input index
+            chunks = [content.iloc[start:start + chunk_size] for start in range(0, n_rows, chunk_size)]
+            self.logger.info(f"Cleaning text in {len(chunks)} chunks with n_jobs={n_jobs}")
+            parts = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(self._clean_content_chunk)(chunk) for chunk in chunks
+            )
+            return pd.concat(parts)
+        
+        return self._clean_content_chunk(content)
+    
+    def _clean_content_chunk(self, content: pd.Series) -> pd.Series:
+        """
+        Clean one Series of contents in-process.
+        
+        Args:
+            content: Series of raw texts; non-string values are treated as empty
+            
+        Returns:
+            Series of cleaned texts
+        """
+        cleaned = content.where(content.map(lambda v: isinstance(v, str)), '').astype(object)
+        
+        for removal_pattern in self._get_removal_patterns():
+            cleaned = cleaned.str.replace(removal_pattern, '', regex=True)
+        
+        if self.normalization_config.get("handle_emojis", "keep") == "replace":
+            cleaned = cleaned.map(self._replace_emojis)
+        
+        cleaned = cleaned.str.replace(self.WHITESPACE_PATTERN, ' ', regex=True).str.strip()
+        
+        if self.normalization_config.get("lowercase", False):
+            cleaned = cleaned.str.lower()
+        
+        return cleaned
+    
+    def clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean a DataFrame of tweets column-wise.
+        
+        Equivalent to clean_batch but keeps the data columnar instead of
+        materializing one dictionary per tweet.
+        
+        Args:
+            df: DataFrame of tweets
+            
+        Returns:
+            Cleaned DataFrame with retweets and invalid tweets removed
+        """
+        self.logger.info(f"Cleaning {len(df)} tweets...")
+        
+        cleaned = df.copy()
+        
+        # Clean content
+        if 'content' in cleaned.columns:
+            cleaned['content'] = self._clean_content(cleaned['content'])
+            cleaned['content_length'] = cleaned['content'].str.len()
+        
+        # Handle Unicode
+        if self.cleaning_config.get("handle_unicode", True):
+            for column in cleaned.columns[cleaned.dtypes == object]:
+                cleaned[column] = self._normalize_series(cleaned[column])
+        
+        # Validate content length
+        min_length = self.cleaning_config.get("min_content_length", 10)
+        content_length = cleaned['content_length'] if 'content_length' in cleaned.columns else 0
+        cleaned['is_valid'] = content_length >= min_length
         
         # Apply filters
-        cleaned = self.filter_retweets(cleaned)
-        cleaned = self.filter_invalid_tweets(cleaned)
+        keep = cleaned['is_valid']
+        if self.cleaning_config.get("remove_retweets", True) and 'content' in cleaned.columns:
+            is_retweet = cleaned['content'].str.startswith('RT @')
+            self.logger.info(f"Filtered retweets: {len(cleaned)} -> {len(cleaned) - int(is_retweet.sum())}")
+            keep &= ~is_retweet
+        
+        cleaned = cleaned[keep].reset_index(drop=True)
         
         self.logger.info(f"Cleaning complete: {len(cleaned)} tweets")
         return cleaned
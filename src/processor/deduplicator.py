@@ -3,9 +3,13 @@ Deduplication module for tweet data.
 Implements multiple strategies for finding and removing duplicates.
 """
 
-from collections import defaultdict
+import math
+from collections import Counter, defaultdict
 from typing import Dict, List, Set
 
+import numpy as np
+import pandas as pd
+
 from ..utils import Logger, generate_hash
 
 
@@ -60,6 +64,41 @@ class Deduplicator:
         
         return result
     
+    def deduplicate_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Deduplicate a DataFrame of tweets based on configured method.
+        
+        Args:
+            df: DataFrame of tweets
+            
+        Returns:
+            Deduplicated DataFrame
+        """
+        if len(df) == 0:
+            return df
+        
+        self.logger.info(f"Deduplicating {len(df)} tweets using method: {self.method}")
+        
+        if self.method == "tweet_id":
+            tweet_ids = df['tweet_id'] if 'tweet_id' in df.columns else pd.Series(None, index=df.index)
+            keep = tweet_ids.notna() & tweet_ids.astype(bool) & ~tweet_ids.duplicated()
+        elif self.method == "fuzzy":
+            # Pairwise similarity has no columnar form; reuse the record path
+            return pd.DataFrame(self._deduplicate_fuzzy(df.to_dict('records')), columns=df.columns)
+        else:
+            if self.method != "content_hash":
+                self.logger.warning(f"Unknown method '{self.method}', using content_hash")
+            usernames = df['username'] if 'username' in df.columns else pd.Series('', index=df.index)
+            contents = df['content'] if 'content' in df.columns else pd.Series('', index=df.index)
+            keep = ~pd.DataFrame({'username': usernames, 'content': contents}).duplicated()
+        
+        result = df[keep].reset_index(drop=True)
+        
+        removed_count = len(df) - len(result)
+        self.logger.info(f"Deduplication complete: removed {removed_count} duplicates, {len(result)} unique tweets remain")
+        
+        return result
+    
     def _deduplicate_by_tweet_id(self, tweets: List[Dict]) -> List[Dict]:
         """
         Deduplicate by tweet ID.
@@ -70,16 +109,11 @@ class Deduplicator:
         Returns:
             Deduplicated list
         """
-        seen_ids: Set[str] = set()
-        unique_tweets = []
-        
-        for tweet in tweets:
-            tweet_id = tweet.get('tweet_id')
-            if tweet_id and tweet_id not in seen_ids:
-                seen_ids.add(tweet_id)
-                unique_tweets.append(tweet)
+        tweet_ids = pd.Series([tweet.get('tweet_id') for tweet in tweets], dtype=object)
+        has_id = np.fromiter((bool(tweet_id) for tweet_id in tweet_ids), dtype=bool, count=len(tweets))
+        keep = has_id & ~tweet_ids.duplicated().to_numpy()
         
-        return unique_tweets
+        return [tweets[i] for i in np.flatnonzero(keep)]
     
     def _deduplicate_by_content_hash(self, tweets: List[Dict]) -> List[Dict]:
         """
@@ -91,51 +125,78 @@ class Deduplicator:
         Returns:
             Deduplicated list
         """
-        seen_hashes: Set[str] = set()
-        unique_tweets = []
-        
-        for tweet in tweets:
-            content = tweet.get('content', '')
-            username = tweet.get('username', '')
-            
-            # Create hash from content + username
-            content_hash = generate_hash(f"{username}_{content}")
-            
-            if content_hash not in seen_hashes:
-                seen_hashes.add(content_hash)
-                unique_tweets.append(tweet)
-        
-        return unique_tweets
+        # Key on username + content; duplicated() hashes the pairs in one
+        # vectorized pass and keeps the first occurrence of each
+        keys = pd.DataFrame({
+            'username': [tweet.get('username', '') for tweet in tweets],
+            'content': [tweet.get('content', '') for tweet in tweets],
+        })
+        keep = ~keys.duplicated().to_numpy()
+        
+        return [tweets[i] for i in np.flatnonzero(keep)]
     
     def _deduplicate_fuzzy(self, tweets: List[Dict]) -> List[Dict]:
         """
         Deduplicate using fuzzy matching for near-duplicates.
         Uses Jaccard similarity on word sets.
         
+        Candidates are found with prefix filtering: with words ordered
+        rarest first, two sets with Jaccard similarity >= threshold must share
+        a word within their first len - ceil(threshold * len) + 1 words, and
+        their sizes must satisfy threshold <= min(len) / max(len). Only kept
+        tweets passing both filters are compared, which gives the same result
+        as comparing against every kept tweet.
+        
         Args:
             tweets: List of tweet dictionaries
             
         Returns:
             Deduplicated list
         """
+        threshold = self.similarity_threshold
+        if threshold <= 0:
+            # Every pair is similar enough; only the first tweet survives
+            return tweets[:1]
+        
+        word_sets = [frozenset(tweet.get('content', '').lower().split()) for tweet in tweets]
+        frequency = Counter(word for words in word_sets for word in words)
+        
         unique_tweets = []
         tweet_word_sets = []
-        
-        for tweet in tweets:
-            content = tweet.get('content', '').lower()
-            words = set(content.split())
-            
-            # Check similarity with existing tweets
-            is_duplicate = False
-            for existing_words in tweet_word_sets:
-                similarity = self._jaccard_similarity(words, existing_words)
-                if similarity >= self.similarity_threshold:
-                    is_duplicate = True
-                    break
+        tweet_sizes = []
+        prefix_index: Dict[str, List[int]] = defaultdict(list)
+        kept_empty = False
+        
+        for tweet, words in zip(tweets, word_sets):
+            if not words:
+                # Two empty sets have similarity 1.0 and match nothing else
+                is_duplicate = kept_empty and threshold <= 1.0
+                kept_empty = kept_empty or not is_duplicate
+            else:
+                size = len(words)
+                min_size = math.ceil(threshold * size - 1e-9)
+                max_size = math.floor(size / threshold + 1e-9)
+                
+                ordered = sorted(words, key=lambda word: (frequency[word], word))
+                prefix = ordered[:size - min_size + 1]
+                
+                # Check similarity with existing tweets sharing a prefix word
+                # whose size is compatible with the threshold
+                candidates = {index for word in prefix for index in prefix_index.get(word, ())}
+                is_duplicate = any(
+                    min_size <= tweet_sizes[index] <= max_size
+                    and self._jaccard_similarity(words, tweet_word_sets[index]) >= threshold
+                    for index in candidates
+                )
+                
+                if not is_duplicate:
+                    for word in prefix:
+                        prefix_index[word].append(len(tweet_word_sets))
             
             if not is_duplicate:
                 unique_tweets.append(tweet)
                 tweet_word_sets.append(words)
+                tweet_sizes.append(len(words))
         
         return unique_tweets
     
@@ -155,7 +216,7 @@ class Deduplicator:
             return 1.0
         
         intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        union = len(set1) + len(set2) - intersection
         
         return intersection / union if union > 0 else 0.0
     
@@ -169,16 +230,22 @@ class Deduplicator:
         Returns:
             Dictionary mapping hash to list of duplicate tweets
         """
-        hash_to_tweets = defaultdict(list)
-        
-        for tweet in tweets:
-            content = tweet.get('content', '')
-            username = tweet.get('username', '')
-            content_hash = generate_hash(f"{username}_{content}")
-            hash_to_tweets[content_hash].append(tweet)
-        
-        # Filter to only duplicates
-        duplicates = {k: v for k, v in hash_to_tweets.items() if len(v) > 1}
+        keys = pd.DataFrame({
+            'username': [tweet.get('username', '') for tweet in tweets],
+            'content': [tweet.get('content', '') for tweet in tweets],
+        })
+        
+        # Only rows whose key repeats are grouped and hashed; unique rows
+        # never allocate a group
+        key_to_tweets = defaultdict(list)
+        for i in np.flatnonzero(keys.duplicated(keep=False).to_numpy()):
+            tweet = tweets[i]
+            key_to_tweets[(tweet.get('username', ''), tweet.get('content', ''))].append(tweet)
+        
+        duplicates = {
+            generate_hash(f"{username}_{content}"): group
+            for (username, content), group in key_to_tweets.items()
+        }
         
         total_duplicates = sum(len(v) - 1 for v in duplicates.values())
         self.logger.info(f"Found {len(duplicates)} groups of duplicates, {total_duplicates} total duplicate tweets")
@@ -3,19 +3,53 @@ Storage module for handling tweet data persistence.
 Supports efficient Parquet format with compression.
 """
 
+import atexit
+import os
+import shutil
+import time
+import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
 
 from ..utils import Logger
 
+# Row filters: DNF tuples (as for pd.read_parquet) or a pyarrow expression
+ParquetFilters = Union[List[Tuple], List[List[Tuple]], pc.Expression]
+
 
 class ParquetStorage:
     """Handle tweet storage in Parquet format."""
     
+    # Parquet codecs that accept a compression level
+    LEVELED_CODECS = ("zstd", "gzip", "brotli")
+    
+    # Columns load_in_chunks reads when the caller doesn't choose any
+    DEFAULT_PROJECTION = ["tweet_id", "content", "timestamp"]
+    
+    # Columns of a scraped tweet, so records convert and stream without type inference
+    RAW_TWEET_SCHEMA = pa.schema([
+        ("tweet_id", pa.string()),
+        ("username", pa.string()),
+        ("timestamp", pa.string()),
+        ("content", pa.string()),
+        ("hashtags", pa.list_(pa.string())),
+        ("hashtags_lower", pa.list_(pa.string())),
+        ("mentions", pa.list_(pa.string())),
+        ("likes", pa.int64()),
+        ("retweets", pa.int64()),
+        ("replies", pa.int64()),
+        ("views", pa.int64()),
+        ("scraped_at", pa.string()),
+    ])
+    
     def __init__(self, config: dict, logger: Logger = None):
         """
         Initialize Parquet storage handler.
@@ -32,9 +66,32 @@ class ParquetStorage:
         self.parquet_config = self.storage_config.get("parquet", {})
         self.paths_config = self.storage_config.get("paths", {})
         
-        # Compression settings
-        self.compression = self.parquet_config.get("compression", "snappy")
+        # Compression settings; zstd shrinks text-heavy tweet files well below
+        # snappy at similar write speed. CPU-bound setups on fast local disks
+        # can switch to snappy or lz4, which ignore compression_level.
+        self.compression = self.parquet_config.get("compression", "zstd")
+        self.compression_level = (
+            self.parquet_config.get("compression_level", 3)
+            if self.compression in self.LEVELED_CODECS else None
+        )
         self.engine = self.parquet_config.get("engine", "pyarrow")
+        self.row_group_size = self.parquet_config.get("row_group_size", 262_144)
+        
+        # Tweet file layout: "file" rewrites a single file on append, "dataset"
+        # stores a directory of part files so appends only write new rows.
+        # Hive partition columns (e.g. ["date"]) imply the dataset layout.
+        self.partition_by = self.parquet_config.get("partition_by") or []
+        self.layout = "dataset" if self.partition_by else self.parquet_config.get("layout", "file")
+        
+        # Open raw tweet stream: (writer, in-progress path, final path) and
+        # record batches waiting to fill a row group
+        self._raw_stream: Optional[Tuple[pq.ParquetWriter, Path, Path]] = None
+        self._raw_pending: List[pa.RecordBatch] = []
+        self._raw_pending_rows = 0
+        
+        # Dataset last streamed by load_in_chunks per input path, keyed by
+        # the (part, mtime, size) of its files so footers are parsed once
+        self._chunk_datasets: Dict[str, Tuple[tuple, ds.Dataset]] = {}
         
         # Create directories
         self._ensure_directories()
@@ -47,12 +104,12 @@ class ParquetStorage:
             path = Path(path_value)
             path.parent.mkdir(parents=True, exist_ok=True)
     
-    def save_raw_tweets(self, tweets: List[Dict], append: bool = False) -> str:
+    def save_raw_tweets(self, tweets: Union[List[Dict], pd.DataFrame], append: bool = False) -> str:
         """
         Save raw tweets to Parquet file.
         
         Args:
-            tweets: List of tweet dictionaries
+            tweets: List of tweet dictionaries or DataFrame
             append: Whether to append to existing file
             
         Returns:
@@ -61,12 +118,130 @@ class ParquetStorage:
         output_path = self.paths_config.get("raw_data", "data/raw/tweets_raw.parquet")
         return self._save_to_parquet(tweets, output_path, append=append)
     
-    def save_processed_tweets(self, tweets: List[Dict], append: bool = False) -> str:
+    def stream_raw_tweets(self, tweets: List[Dict]) -> int:
         """
-        Save processed tweets to Parquet file.
+        Stream a batch of scraped tweets to the raw Parquet store.
+        
+        Records go straight into an Arrow record batch with
+        RAW_TWEET_SCHEMA (no DataFrame, no type inference); keys outside
+        the schema are dropped. Batches are buffered up to row_group_size
+        rows and written through a ParquetWriter held open across calls,
+        so small scrape batches don't leave tiny row groups behind. The
+        first call starts an in-progress file (a new part file in the
+        dataset layout); rows become visible to loads once close()
+        finalizes it, which also runs at interpreter exit. An existing raw
+        file is appended to, not replaced.
         
         Args:
             tweets: List of tweet dictionaries
+            
+        Returns:
+            Number of tweets written
+        """
+        if not tweets:
+            return 0
+        
+        if self.partition_by:
+            # Partitioned datasets can't be fed through a single file writer
+            self.save_raw_tweets(tweets, append=True)
+            return len(tweets)
+        
+        if self._raw_stream is None:
+            self._raw_stream = self._open_raw_stream()
+        
+        batch = pa.RecordBatch.from_pylist(tweets, schema=self.RAW_TWEET_SCHEMA)
+        self._raw_pending.append(batch)
+        self._raw_pending_rows += batch.num_rows
+        if self._raw_pending_rows >= self.row_group_size:
+            self._flush_raw_stream(full_groups_only=True)
+        return batch.num_rows
+    
+    def _open_raw_stream(self) -> Tuple[pq.ParquetWriter, Path, Path]:
+        """
+        Open a Parquet writer for streamed raw tweets.
+        
+        The writer targets an in-progress file, so existing data stays
+        readable until close() moves the finished file into place (or
+        appends it to an existing raw file).
+        
+        Returns:
+            Tuple of (writer, in-progress path, final path)
+        """
+        path = Path(self.paths_config.get("raw_data", "data/raw/tweets_raw.parquet"))
+        if self.layout == "dataset":
+            path.mkdir(parents=True, exist_ok=True)
+            path = path / f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}-0.parquet"
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Not '.part', which _append_to_parquet uses for its own temp file
+        part_path = path.with_name(path.name + '.stream')
+        writer = pq.ParquetWriter(
+            part_path,
+            self.RAW_TWEET_SCHEMA,
+            compression=self.compression,
+            compression_level=self.compression_level
+        )
+        atexit.register(self.close)
+        self.logger.info(f"Streaming raw tweets to {path}")
+        return writer, part_path, path
+    
+    def _flush_raw_stream(self, full_groups_only: bool = False):
+        """
+        Write buffered raw tweet batches to the open stream.
+        
+        Args:
+            full_groups_only: Write only whole row_group_size groups and keep
+                the remainder buffered
+        """
+        table = pa.Table.from_batches(self._raw_pending, schema=self.RAW_TWEET_SCHEMA)
+        num_rows = table.num_rows
+        if full_groups_only:
+            num_rows -= num_rows % self.row_group_size
+        
+        if num_rows:
+            self._raw_stream[0].write_table(table.slice(0, num_rows), row_group_size=self.row_group_size)
+        
+        remainder = table.slice(num_rows)
+        self._raw_pending = remainder.to_batches()
+        self._raw_pending_rows = remainder.num_rows
+    
+    def close(self):
+        """Finalize the raw tweet stream, if one is open."""
+        if self._raw_stream is None:
+            return
+        
+        self._flush_raw_stream()
+        writer, part_path, path = self._raw_stream
+        self._raw_stream = None
+        atexit.unregister(self.close)
+        
+        writer.close()
+        if path.exists():
+            # Keep the rows already stored; the in-progress file is only
+            # removed once the append succeeded
+            self._save_table_to_parquet(
+                pq.read_table(part_path), str(path), append=True, row_group_size=self.row_group_size
+            )
+            part_path.unlink()
+        else:
+            os.replace(part_path, path)
+        self.logger.info(f"Saved streamed raw tweets to {path}")
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def save_processed_tweets(self, tweets: Union[List[Dict], pd.DataFrame], append: bool = False) -> str:
+        """
+        Save processed tweets to Parquet file.
+        
+        Args:
+            tweets: List of tweet dictionaries or DataFrame
             append: Whether to append to existing file
             
         Returns:
@@ -91,11 +266,13 @@ class ParquetStorage:
         else:
             output_path = self.paths_config.get("analysis_output", "data/analysis/signals.parquet")
         
-        return self._save_dataframe_to_parquet(data, output_path)
+        # Groups of at least row_group_size rows, and at most one per CPU
+        row_group_size = max(self.row_group_size, len(data) // (os.cpu_count() or 1))
+        return self._save_dataframe_to_parquet(data, output_path, row_group_size=row_group_size)
     
     def _save_to_parquet(
         self,
-        tweets: List[Dict],
+        tweets: Union[List[Dict], pd.DataFrame],
         output_path: str,
         append: bool = False
     ) -> str:
@@ -103,30 +280,186 @@ class ParquetStorage:
         Save tweets to Parquet file.
         
         Args:
-            tweets: List of tweet dictionaries
+            tweets: List of tweet dictionaries or DataFrame
             output_path: Output file path
             append: Whether to append to existing file
             
         Returns:
             Path to saved file
         """
-        if not tweets:
+        if len(tweets) == 0:
             self.logger.warning("No tweets to save")
             return output_path
         
         self.logger.info(f"Saving {len(tweets)} tweets to {output_path}")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(tweets)
+        if isinstance(tweets, pd.DataFrame):
+            table = pa.Table.from_pandas(tweets, preserve_index=False)
+        else:
+            table = self._records_to_table(tweets)
+        
+        if self.layout == "dataset":
+            return self._save_dataset(table, output_path, append=append)
+        
+        # Save in bounded row groups so filtered loads can skip groups by statistics
+        return self._save_table_to_parquet(table, output_path, append=append, row_group_size=self.row_group_size)
+    
+    def _save_dataset(self, table: pa.Table, output_path: str, append: bool = False) -> str:
+        """
+        Save tweets as a dataset directory of part files.
+        
+        Appends add new part files instead of rewriting existing data, and
+        loads read the directory as one table. With partition_by set, parts
+        go to Hive directories (e.g. date=2024-01-01/part-....parquet) that
+        filtered loads skip whole; a 'date' partition is derived from the
+        tweet timestamp when the data has no 'date' column.
+        
+        Args:
+            table: Tweets to save
+            output_path: Output dataset directory
+            append: Whether to add to an existing dataset
+            
+        Returns:
+            Path to saved dataset
+        """
+        path = Path(output_path)
+        
+        if 'date' in self.partition_by and 'date' not in table.column_names and 'timestamp' in table.column_names:
+            timestamps = table.column('timestamp')
+            if pa.types.is_timestamp(timestamps.type):
+                dates = pc.strftime(timestamps, format='%Y-%m-%d')
+            else:
+                dates = pc.utf8_slice_codeunits(timestamps.cast(pa.string()), 0, 10)
+            table = table.append_column('date', dates)
+        
+        if path.exists() and not append:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        elif path.is_file():
+            # Move a single-file store into the dataset as an unpartitioned part
+            legacy_path = path.with_name(path.name + '.legacy')
+            os.replace(path, legacy_path)
+            path.mkdir()
+            os.replace(legacy_path, path / 'part-0-legacy.parquet')
+        
+        rewrite = False
+        if append and path.is_dir():
+            table, rewrite = self._align_to_dataset(table, path)
+        
+        # A rewrite goes to a sibling directory that replaces the dataset
+        # only once fully written, so a failed write keeps the old rows
+        target = path.with_name(path.name + '.part') if rewrite else path
+        try:
+            if rewrite:
+                shutil.rmtree(target, ignore_errors=True)
+            ds.write_dataset(
+                table,
+                target,
+                format="parquet",
+                partitioning=self.partition_by or None,
+                partitioning_flavor="hive",
+                # Time-ordered names keep appended parts in write order on load
+                basename_template=f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+                max_rows_per_group=self.row_group_size,
+                file_options=ds.ParquetFileFormat().make_write_options(
+                    compression=self.compression,
+                    compression_level=self.compression_level
+                )
+            )
+            if rewrite:
+                old_path = path.with_name(path.name + '.old')
+                shutil.rmtree(old_path, ignore_errors=True)
+                os.replace(path, old_path)
+                os.replace(target, path)
+                shutil.rmtree(old_path)
+        finally:
+            if rewrite:
+                shutil.rmtree(target, ignore_errors=True)
+        
+        partitions = f" partitioned by {self.partition_by}" if self.partition_by else ""
+        self.logger.info(f"Saved {table.num_rows} rows to {path}{partitions}")
+        return str(path)
+    
+    def _align_to_dataset(self, table: pa.Table, path: Path) -> Tuple[pa.Table, bool]:
+        """
+        Match rows being appended to the schema of an existing dataset.
+        
+        New rows are cast to the dataset schema so every part file agrees,
+        e.g. an all-null column is stored with the dataset's type. If the
+        columns or types cannot be matched, existing and new rows are
+        promoted to a common schema for the caller to rewrite the dataset.
+        
+        Args:
+            table: Table to append
+            path: Existing dataset directory
+            
+        Returns:
+            Table to write, and whether it replaces the whole dataset
+        """
+        parts = sorted(str(p) for p in path.rglob("*.parquet") if p.is_file())
+        if not parts:
+            return table, False
+        
+        dataset = ds.dataset(parts, format="parquet", partitioning="hive", partition_base_dir=str(path))
+        schema = dataset.schema
+        try:
+            if set(table.column_names) != set(schema.names):
+                raise KeyError("column mismatch")
+            return table.select(schema.names).cast(schema), False
+        except (KeyError, ValueError, pa.ArrowException):
+            pass
+        
+        table = pa.concat_tables([dataset.to_table(), table], promote_options="permissive")
+        self.logger.info(f"Rewriting dataset with unified schema. Total rows: {table.num_rows}")
+        return table, True
+    
+    @classmethod
+    def _records_to_table(cls, records: List[Dict]) -> pa.Table:
+        """
+        Build an Arrow table directly from tweet dictionaries.
+        
+        Skips the pandas DataFrame round trip (boxing and dtype inference per
+        value). Columns are the union of keys in first-seen order, like
+        pd.DataFrame(records); missing keys become nulls. String and list
+        columns named in RAW_TWEET_SCHEMA are converted with its type,
+        skipping inference (and typing empty lists), unless their values
+        don't fit it. Integer columns are still inferred, since a typed
+        conversion would silently truncate float counts.
         
-        # Save
-        return self._save_dataframe_to_parquet(df, output_path, append=append)
+        Args:
+            records: List of tweet dictionaries
+            
+        Returns:
+            Arrow table
+        """
+        names = list(dict.fromkeys(key for record in records for key in record))
+        known_types = {
+            field.name: field.type for field in cls.RAW_TWEET_SCHEMA
+            if not pa.types.is_integer(field.type)
+        }
+        
+        columns = {}
+        for name in names:
+            values = [record.get(name) for record in records]
+            if name in known_types:
+                try:
+                    columns[name] = pa.array(values, type=known_types[name])
+                    continue
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    pass
+            columns[name] = pa.array(values)
+        
+        return pa.Table.from_pydict(columns)
     
     def _save_dataframe_to_parquet(
         self,
         df: pd.DataFrame,
         output_path: str,
-        append: bool = False
+        append: bool = False,
+        row_group_size: Optional[int] = None
     ) -> str:
         """
         Save DataFrame to Parquet file.
@@ -135,6 +468,29 @@ class ParquetStorage:
             df: DataFrame to save
             output_path: Output file path
             append: Whether to append to existing file
+            row_group_size: Optional maximum rows per row group
+            
+        Returns:
+            Path to saved file
+        """
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return self._save_table_to_parquet(table, output_path, append=append, row_group_size=row_group_size)
+    
+    def _save_table_to_parquet(
+        self,
+        table: pa.Table,
+        output_path: str,
+        append: bool = False,
+        row_group_size: Optional[int] = None
+    ) -> str:
+        """
+        Save Arrow table to Parquet file.
+        
+        Args:
+            table: Table to save
+            output_path: Output file path
+            append: Whether to append to existing file
+            row_group_size: Optional maximum rows per row group
             
         Returns:
             Path to saved file
@@ -143,80 +499,228 @@ class ParquetStorage:
         path.parent.mkdir(parents=True, exist_ok=True)
         
         if append and path.exists():
-            # Load existing data and append
-            existing_df = pd.read_parquet(path)
-            df = pd.concat([existing_df, df], ignore_index=True)
-            self.logger.info(f"Appending to existing file. Total rows: {len(df)}")
+            appended = self._append_to_parquet(table, path)
+            if appended is not None:
+                return appended
+            
+            # Schemas differ: promote existing and new rows to a common schema
+            table = pa.concat_tables([pq.read_table(path), table], promote_options="permissive")
+            self.logger.info(f"Appending to existing file. Total rows: {table.num_rows}")
         
         # Save with compression
-        df.to_parquet(
+        pq.write_table(
+            table,
             path,
-            engine=self.engine,
             compression=self.compression,
-            index=False
+            compression_level=self.compression_level,
+            row_group_size=row_group_size
         )
         
         file_size = path.stat().st_size / (1024 * 1024)  # MB
-        self.logger.info(f"Saved {len(df)} rows to {path} ({file_size:.2f} MB)")
+        self.logger.info(f"Saved {table.num_rows} rows to {path} ({file_size:.2f} MB)")
+        
+        return str(path)
+    
+    def _append_to_parquet(self, table: pa.Table, path: Path) -> Optional[str]:
+        """
+        Append rows to a Parquet file by streaming it into a new file.
+        
+        Existing row groups are copied one at a time and the new rows are
+        written after them, so memory stays bounded by a row group instead
+        of the whole file. A trailing row group smaller than row_group_size
+        is merged with the new rows, so repeated appends don't leave many
+        small groups behind. The new file replaces the old one atomically.
+        
+        Args:
+            table: Table to append
+            path: Existing Parquet file
+            
+        Returns:
+            Path to saved file, or None if table does not match the file schema
+        """
+        existing = pq.ParquetFile(path)
+        schema = existing.schema_arrow
+        try:
+            if set(table.column_names) != set(schema.names):
+                raise KeyError("column mismatch")
+            table = table.select(schema.names).cast(schema)
+        except (KeyError, ValueError, pa.ArrowException):
+            existing.close()
+            return None
+        
+        total_rows = existing.metadata.num_rows + table.num_rows
+        self.logger.info(f"Appending to existing file. Total rows: {total_rows}")
+        
+        part_path = path.with_name(path.name + '.part')
+        try:
+            with existing, pq.ParquetWriter(
+                part_path,
+                schema,
+                compression=self.compression,
+                compression_level=self.compression_level
+            ) as writer:
+                n_groups = existing.num_row_groups
+                last_rows = existing.metadata.row_group(n_groups - 1).num_rows if n_groups else 0
+                if 0 < last_rows < self.row_group_size:
+                    n_groups -= 1
+                    table = pa.concat_tables([existing.read_row_group(n_groups), table])
+                
+                for i in range(n_groups):
+                    writer.write_table(existing.read_row_group(i))
+                writer.write_table(table, row_group_size=self.row_group_size)
+            os.replace(part_path, path)
+        finally:
+            part_path.unlink(missing_ok=True)
+        
+        file_size = path.stat().st_size / (1024 * 1024)  # MB
+        self.logger.info(f"Saved {total_rows} rows to {path} ({file_size:.2f} MB)")
         
         return str(path)
     
-    def load_raw_tweets(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def load_raw_tweets(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[ParquetFilters] = None
+    ) -> pd.DataFrame:
         """
         Load raw tweets from Parquet file.
         
         Args:
             columns: Optional list of columns to load
+            filters: Optional row filters pushed down to the Parquet scan
             
         Returns:
             DataFrame with tweet data
         """
         input_path = self.paths_config.get("raw_data", "data/raw/tweets_raw.parquet")
-        return self._load_from_parquet(input_path, columns=columns)
+        return self._load_from_parquet(input_path, columns=columns, filters=filters)
     
-    def load_processed_tweets(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def load_processed_tweets(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[ParquetFilters] = None
+    ) -> pd.DataFrame:
         """
         Load processed tweets from Parquet file.
         
         Args:
             columns: Optional list of columns to load
+            filters: Optional row filters pushed down to the Parquet scan
             
         Returns:
             DataFrame with tweet data
         """
         input_path = self.paths_config.get("processed_data", "data/processed/tweets_processed.parquet")
-        return self._load_from_parquet(input_path, columns=columns)
+        return self._load_from_parquet(input_path, columns=columns, filters=filters)
+    
+    def count_raw_tweets(self) -> int:
+        """
+        Count raw tweets from Parquet footer metadata without loading them.
+        
+        Returns:
+            Number of stored raw tweets (0 if none)
+        """
+        input_path = self.paths_config.get("raw_data", "data/raw/tweets_raw.parquet")
+        return self._count_parquet_rows(input_path)
+    
+    def count_processed_tweets(self) -> int:
+        """
+        Count processed tweets from Parquet footer metadata without loading them.
+        
+        Returns:
+            Number of stored processed tweets (0 if none)
+        """
+        input_path = self.paths_config.get("processed_data", "data/processed/tweets_processed.parquet")
+        return self._count_parquet_rows(input_path)
+    
+    def _resolve_parquet_source(self, input_path: str) -> Optional[Union[str, List[str]]]:
+        """
+        Resolve a file or directory path to the Parquet file(s) it holds.
+        
+        Args:
+            input_path: Input file or directory path
+            
+        Returns:
+            File path, list of part files, or None if nothing to read
+        """
+        path = Path(input_path)
+        
+        if not path.exists():
+            self.logger.warning(f"File not found: {path}")
+            return None
+        
+        if path.is_dir():
+            # Only pick up Parquet parts (raw dir also holds JSON checkpoints)
+            source = sorted(str(p) for p in path.rglob("*.parquet") if p.is_file())
+            if not source:
+                self.logger.warning(f"No Parquet files found in: {path}")
+                return None
+            return source
+        
+        return str(path)
+    
+    def _count_parquet_rows(self, input_path: str) -> int:
+        """
+        Sum row counts from Parquet footers, without reading any column data.
+        
+        Args:
+            input_path: Input file or directory path
+            
+        Returns:
+            Total number of rows
+        """
+        source = self._resolve_parquet_source(input_path)
+        if source is None:
+            return 0
+        
+        if isinstance(source, str):
+            return pq.read_metadata(source).num_rows
+        return sum(pq.read_metadata(part).num_rows for part in source)
     
     def _load_from_parquet(
         self,
         input_path: str,
-        columns: Optional[List[str]] = None
+        columns: Optional[List[str]] = None,
+        filters: Optional[ParquetFilters] = None
     ) -> pd.DataFrame:
         """
-        Load data from Parquet file.
+        Load data from a Parquet file or a directory of Parquet files.
+        
+        Files are scanned through a pyarrow dataset so multi-file inputs
+        are read in parallel on the Arrow thread pool. The table is handed
+        to pandas column by column, releasing Arrow buffers as it goes, so
+        numeric columns without nulls may be read-only views; copy a column
+        before writing into it in place. Filters are applied
+        during the scan: row groups whose min/max statistics rule out a
+        comparison (numeric, timestamp or string ==, <, >=, in, ...) are
+        skipped without being decoded.
         
         Args:
-            input_path: Input file path
+            input_path: Input file or directory path
             columns: Optional list of columns to load
+            filters: Optional row filters, either DNF tuples as accepted by
+                pd.read_parquet, e.g. [[("likes", ">=", 10), ("lang", "==", "en")]],
+                or a pyarrow compute expression
             
         Returns:
             DataFrame with data
         """
-        path = Path(input_path)
-        
-        if not path.exists():
-            self.logger.warning(f"File not found: {path}")
+        source = self._resolve_parquet_source(input_path)
+        if source is None:
             return pd.DataFrame()
         
-        self.logger.info(f"Loading data from {path}")
+        self.logger.info(f"Loading data from {input_path}")
         
-        df = pd.read_parquet(
-            path,
-            engine=self.engine,
-            columns=columns
-        )
+        # Directories may be Hive-partitioned (key=value/); those keys become columns
+        partition_base_dir = input_path if isinstance(source, list) else None
+        dataset = ds.dataset(source, format="parquet", partitioning="hive", partition_base_dir=partition_base_dir)
+        if filters is not None and not isinstance(filters, pc.Expression):
+            filters = pq.filters_to_expression(filters)
+        table = dataset.to_table(columns=columns, filter=filters, use_threads=True)
+        df = table.to_pandas(split_blocks=True, self_destruct=True, deduplicate_objects=True)
+        del table
         
-        self.logger.info(f"Loaded {len(df)} rows")
+        self.logger.info(f"Loaded {len(df.index)} rows")
         return df
     
     def get_file_info(self, file_path: str) -> Dict:
@@ -234,49 +738,124 @@ class ParquetStorage:
         if not path.exists():
             return {"exists": False}
         
-        # Get file size
-        file_size_mb = path.stat().st_size / (1024 * 1024)
+        # Footer details are cached per (path, mtime, size), so a rewritten
+        # file is re-read while repeated calls skip parsing the footer
+        stat = path.stat()
+        info = self._read_file_info(str(path), stat.st_mtime_ns, stat.st_size)
+        return {**info, "columns": list(info["columns"])}
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _read_file_info(path: str, mtime_ns: int, size: int) -> Dict:
+        """
+        Read file information from a Parquet footer.
         
-        # Get row count and schema
-        parquet_file = pq.ParquetFile(path)
-        num_rows = parquet_file.metadata.num_rows
-        schema = parquet_file.schema_arrow
+        Args:
+            path: Path to Parquet file
+            mtime_ns: File modification time, part of the cache key
+            size: File size in bytes
+            
+        Returns:
+            Dictionary with file information
+        """
+        metadata = pq.read_metadata(path)
+        schema = metadata.schema.to_arrow_schema()
         
         return {
             "exists": True,
-            "path": str(path),
-            "size_mb": round(file_size_mb, 2),
-            "num_rows": num_rows,
+            "path": path,
+            "size_mb": round(size / (1024 * 1024), 2),
+            "num_rows": metadata.num_rows,
             "num_columns": len(schema),
             "columns": schema.names,
-            "compression": parquet_file.metadata.row_group(0).column(0).compression
+            "compression": metadata.row_group(0).column(0).compression
         }
     
     def load_in_chunks(
         self,
         input_path: str,
         chunk_size: int = 1000,
-        columns: Optional[List[str]] = None
+        columns: Optional[List[str]] = None,
+        content_column: Optional[str] = None
     ):
         """
-        Generator to load Parquet file in chunks for memory efficiency.
+        Generator to load Parquet data in chunks for memory efficiency.
+        
+        Batches come from a threaded dataset scan, so row groups (and the
+        files of a dataset directory) are decoded in parallel ahead of the
+        consumer while chunks are still yielded in order. Only the columns
+        asked for are decompressed and converted to pandas: by default the
+        storage.parquet.default_projection columns present in the data
+        (tweet_id, content and timestamp unless configured otherwise), or
+        every column if the data has none of them.
         
         Args:
-            input_path: Input file path
-            chunk_size: Number of rows per chunk
-            columns: Optional list of columns to load
+            input_path: Input file or directory path
+            chunk_size: Maximum number of rows per chunk
+            columns: Optional list of columns to load; pass [] to load all
+            content_column: Load only this column (overrides columns)
             
         Yields:
-            DataFrame chunks
+            DataFrame chunks (numeric columns may be read-only views)
         """
-        path = Path(input_path)
-        
-        if not path.exists():
-            self.logger.warning(f"File not found: {path}")
+        source = self._resolve_parquet_source(input_path)
+        if source is None:
             return
         
-        parquet_file = pq.ParquetFile(path)
+        dataset = self._chunk_dataset(input_path, source)
+        
+        if content_column is not None:
+            columns = [content_column]
+        elif columns is None:
+            projection = self.parquet_config.get("default_projection", self.DEFAULT_PROJECTION)
+            columns = [name for name in projection if name in dataset.schema.names] or None
+        elif not columns:
+            columns = None
+        
+        scanner = dataset.scanner(columns=columns, batch_size=chunk_size, use_threads=True)
         
-        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
-            df_chunk = batch.to_pandas()
+        for batch in scanner.to_batches():
+            if batch.num_rows == 0:
+                continue
+            df_chunk = pa.Table.from_batches([batch]).to_pandas(
+                split_blocks=True, self_destruct=True, deduplicate_objects=True
+            )
             yield df_chunk
+    
+    def _chunk_dataset(self, input_path: str, source: Union[str, List[str]]) -> ds.Dataset:
+        """
+        Get the dataset load_in_chunks scans, reusing it while files are unchanged.
+        
+        Repeated passes over the same data (e.g. several epochs) reuse the
+        dataset and its parsed footers. Files are memory-mapped and column
+        chunks of a row group are pre-buffered into coalesced reads.
+        
+        Args:
+            input_path: Input file or directory path
+            source: File path or list of part files from _resolve_parquet_source
+            
+        Returns:
+            Dataset over source
+        """
+        parts = [source] if isinstance(source, str) else source
+        key = tuple((part, stat.st_mtime_ns, stat.st_size) for part, stat in ((p, os.stat(p)) for p in parts))
+        
+        cached = self._chunk_datasets.get(input_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        parquet_format = ds.ParquetFileFormat(
+            default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True)
+        )
+        dataset = ds.dataset(
+            source,
+            format=parquet_format,
+            filesystem=pafs.LocalFileSystem(use_mmap=True),
+            partitioning="hive",
+            partition_base_dir=input_path if isinstance(source, list) else None
+        )
+        for fragment in dataset.get_fragments():
+            fragment.ensure_complete_metadata()
+        
+        self._chunk_datasets[input_path] = (key, dataset)
+        return dataset
@@ -3,11 +3,12 @@ Web scraping package for Twitter Market Intelligence System.
 """
 
 from .twitter_scraper import TwitterScraper
-from .anti_detection import StealthDriver, HumanBehavior, get_random_user_agent
+from .anti_detection import StealthDriver, DriverPool, HumanBehavior, get_random_user_agent
 
 __all__ = [
     'TwitterScraper',
     'StealthDriver',
+    'DriverPool',
     'HumanBehavior',
     'get_random_user_agent',
 ]
@@ -3,12 +3,64 @@ Anti-detection utilities for web scraping.
 Implements stealth techniques to avoid bot detection.
 """
 
+import asyncio
 import random
-from typing import Optional
+import re
+import subprocess
+import time
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
 
+import numpy as np
 import undetected_chromedriver as uc
 from fake_useragent import UserAgent
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.action_chains import ActionChains
+
+# UserAgent() loads and parses its browser database on construction, so a
+# single instance is created lazily and shared by every caller.
+_UA_CACHE: Optional[UserAgent] = None
+
+# Scroll by arguments[0] pixels and report the page height from before the
+# scroll, so one WebDriver round-trip replaces a separate height query.
+SCROLL_BY_JS = (
+    "const h0 = document.body.scrollHeight;"
+    "window.scrollBy(0, arguments[0]);"
+    "return h0;"
+)
+SCROLL_HEIGHT_JS = "return document.body.scrollHeight"
+
+# Generator for bulk scroll sessions; draws all deltas and pauses at once.
+_RNG = np.random.default_rng()
+
+
+def _ua() -> UserAgent:
+    """Return the shared UserAgent instance, creating it on first use."""
+    global _UA_CACHE
+    if _UA_CACHE is None:
+        _UA_CACHE = UserAgent()
+    return _UA_CACHE
+
+
+@lru_cache(maxsize=1)
+def _chrome_major_version() -> Optional[int]:
+    """
+    Probe the installed Chrome's major version, once per process.
+    
+    Returns:
+        Major version number, or None if Chrome or its version can't be found
+    """
+    chrome = uc.find_chrome_executable()
+    if not chrome:
+        return None
+    
+    try:
+        result = subprocess.run([chrome, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    match = re.search(r"(\d+)\.\d+", result.stdout)
+    return int(match.group(1)) if match else None
 
 
 class StealthDriver:
@@ -61,21 +113,30 @@ class StealthDriver:
         """
         options = self._get_chrome_options()
         
-        try:
-            # Use undetected-chromedriver with auto version detection
-            self.driver = uc.Chrome(
-                options=options,
-                driver_executable_path=None,  # Auto-download correct version
-                browser_executable_path=None,  # Auto-detect Chrome installation
-                use_subprocess=True,
-                version_main=None  # Auto-detect Chrome version
-            )
-        except Exception as e:
-            # If auto-detection fails, try without version specification
-            if self.logger:
-                self.logger.warning(f"First attempt failed: {e}, trying alternative method...")
+        # Probe Chrome up front so the usual case launches it once
+        version_main = _chrome_major_version()
+        self.driver = None
+        
+        if version_main is not None:
+            try:
+                self.driver = uc.Chrome(
+                    options=options,
+                    driver_executable_path=None,  # Auto-download correct version
+                    browser_executable_path=None,  # Auto-detect Chrome installation
+                    use_subprocess=True,
+                    version_main=version_main
+                )
+            except Exception as e:
+                # e.g. driver download, port or sandbox failure
+                if self.logger:
+                    self.logger.warning(f"First attempt failed: {e}, trying alternative method...")
+        elif self.logger:
+            self.logger.warning("Could not detect Chrome version, using alternative launch method...")
+        
+        if self.driver is None:
+            # uc.Chrome doesn't accept options that were already used
             self.driver = uc.Chrome(
-                options=options,
+                options=self._get_chrome_options() if version_main is not None else options,
                 use_subprocess=False
             )
         
@@ -104,8 +165,7 @@ class StealthDriver:
         
         # User agent
         if self.user_agent_rotation:
-            ua = UserAgent()
-            user_agent = ua.random
+            user_agent = _ua().random
             options.add_argument(f'user-agent={user_agent}')
         
         # Language
@@ -145,6 +205,88 @@ class StealthDriver:
                 pass
 
 
+class DriverPool:
+    """Pool of pre-warmed WebDriver instances shared by concurrent scraping tasks."""
+    
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 4,
+        drivers: Optional[List[Any]] = None,
+        logger = None
+    ):
+        """
+        Initialize driver pool configuration.
+        
+        Args:
+            factory: Callable that creates and returns a new driver
+            size: Number of drivers in the pool
+            drivers: Already running drivers to include in the pool; these
+                are not quit by close()
+            logger: Logger instance
+        """
+        self.factory = factory
+        self.size = size
+        self.logger = logger
+        self._seed_drivers = list(drivers or [])[:size]
+        self._created: List[Any] = []
+        self._queue: Optional[asyncio.Queue] = None
+    
+    async def start(self):
+        """
+        Launch the missing drivers concurrently and fill the pool.
+        
+        Drivers that fail to start are logged and skipped; the pool only
+        fails if it ends up empty.
+        """
+        self._queue = asyncio.Queue()
+        for driver in self._seed_drivers:
+            self._queue.put_nowait(driver)
+        
+        missing = self.size - len(self._seed_drivers)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.factory) for _ in range(missing)),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                if self.logger:
+                    self.logger.warning(f"Failed to start pooled driver: {result}")
+                continue
+            self._created.append(result)
+            self._queue.put_nowait(result)
+        
+        if self._queue.empty():
+            raise RuntimeError("No drivers could be started for the pool")
+    
+    async def acquire(self) -> Any:
+        """
+        Wait for a free driver.
+        
+        Returns:
+            WebDriver instance; hand it back with release()
+        """
+        return await self._queue.get()
+    
+    def release(self, driver: Any):
+        """
+        Return a driver to the pool.
+        
+        Args:
+            driver: Driver obtained from acquire()
+        """
+        self._queue.put_nowait(driver)
+    
+    def close(self):
+        """Quit the drivers this pool created."""
+        for driver in self._created:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._created = []
+
+
 class HumanBehavior:
     """Simulate human-like browsing behavior."""
     
@@ -158,20 +300,59 @@ class HumanBehavior:
             scroll_pause_min: Minimum pause between scrolls
             scroll_pause_max: Maximum pause between scrolls
         """
-        import time
+        # Random scroll amount (not always to bottom) and random pause
+        scroll_amount = random.randint(300, 800)
+        pause_time = random.uniform(scroll_pause_min, scroll_pause_max)
         
-        # Get current scroll position
-        last_height = driver.execute_script("return document.body.scrollHeight")
+        last_height, new_height = HumanBehavior._scroll_step(driver, scroll_amount, pause_time)
+        return new_height != last_height
+    
+    @staticmethod
+    def _scroll_step(driver, scroll_amount: int, pause_time: float) -> Tuple[int, int]:
+        """
+        Scroll by a given amount, pause, and return page heights.
         
-        # Random scroll amount (not always to bottom)
-        scroll_amount = random.randint(300, 800)
-        driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
+        The height before scrolling comes back from the scroll script itself,
+        so each step costs two WebDriver round-trips instead of three.
         
-        # Random pause
-        pause_time = random.uniform(scroll_pause_min, scroll_pause_max)
+        Returns:
+            Tuple of (height before scrolling, height after the pause)
+        """
+        last_height = driver.execute_script(SCROLL_BY_JS, scroll_amount)
+        
+        # Lazily loaded content grows the page during the pause
         time.sleep(pause_time)
         
-        return driver.execute_script("return document.body.scrollHeight") != last_height
+        return last_height, driver.execute_script(SCROLL_HEIGHT_JS)
+    
+    @staticmethod
+    def bulk_scroll(driver, n_scrolls: int, scroll_pause_min: float = 1.0,
+                    scroll_pause_max: float = 3.0) -> Tuple[int, int]:
+        """
+        Perform a series of random scrolls.
+        
+        Scroll deltas and pauses for the whole series are drawn in one
+        vectorized call; the loop only issues WebDriver commands.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            n_scrolls: Number of scrolls to perform
+            scroll_pause_min: Minimum pause between scrolls
+            scroll_pause_max: Maximum pause between scrolls
+            
+        Returns:
+            Tuple of (page height before the first scroll, final page height)
+        """
+        deltas = _RNG.integers(300, 801, size=n_scrolls)
+        pauses = _RNG.uniform(scroll_pause_min, scroll_pause_max, size=n_scrolls)
+        
+        first_height = new_height = None
+        for scroll_amount, pause_time in zip(deltas.tolist(), pauses.tolist()):
+            last_height, new_height = HumanBehavior._scroll_step(driver, scroll_amount, pause_time)
+            if first_height is None:
+                first_height = last_height
+        
+        return first_height, new_height
     
     @staticmethod
     def random_mouse_movement(driver):
@@ -182,8 +363,6 @@ class HumanBehavior:
             driver: Selenium WebDriver instance
         """
         try:
-            from selenium.webdriver.common.action_chains import ActionChains
-            
             actions = ActionChains(driver)
             
             # Random movements
@@ -205,7 +384,6 @@ class HumanBehavior:
             min_seconds: Minimum delay
             max_seconds: Maximum delay
         """
-        import time
         time.sleep(random.uniform(min_seconds, max_seconds))
     
     @staticmethod
@@ -221,16 +399,12 @@ class HumanBehavior:
         Returns:
             True if reached bottom, False otherwise
         """
-        import time
-        
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        
         # Scroll in increments
-        for _ in range(random.randint(3, 6)):
-            HumanBehavior.random_scroll(driver, scroll_pause_min, scroll_pause_max)
+        last_height, new_height = HumanBehavior.bulk_scroll(
+            driver, int(_RNG.integers(3, 7)), scroll_pause_min, scroll_pause_max
+        )
         
         # Check if we've reached the bottom
-        new_height = driver.execute_script("return document.body.scrollHeight")
         return new_height == last_height
 
 
@@ -241,5 +415,4 @@ def get_random_user_agent() -> str:
     Returns:
         Random user agent
     """
-    ua = UserAgent()
-    return ua.random
+    return _ua().random
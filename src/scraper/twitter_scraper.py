@@ -450,13 +450,19 @@ Twitter/X scraper using Selenium with anti-detection measures.
 Scrapes tweets based on hashtags without using paid APIs.
 """
 
-import json
+import asyncio
+import base64
+import re
+import threading
 import time
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
-from bs4 import BeautifulSoup
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -482,7 +488,7 @@ from ..utils import (
 # we still import this if you are using some of its helpers,
 # but we are NOT going to use StealthDriver.create_driver() anymore
 # from .anti_detection import StealthDriver, HumanBehavior
-from .anti_detection import HumanBehavior  # keep HumanBehavior only
+from .anti_detection import DriverPool, HumanBehavior
 
 
 class TwitterScraper:
@@ -490,6 +496,42 @@ class TwitterScraper:
 
     TWITTER_SEARCH_URL = "https://twitter.com/search"
 
+    # Numeric tweet id in a status permalink, e.g. /user/status/1234567890
+    STATUS_ID_PATTERN = re.compile(r'/status/(\d+)')
+
+    # Link selectors, matched by the parser in C instead of per-node Python checks
+    HASHTAG_LINK_SELECTOR = 'a[href*="/hashtag/"]'
+    MENTION_LINK_SELECTOR = 'a[href^="/"]:not([href*="/hashtag/"])'
+
+    # GraphQL operations whose JSON responses carry the tweets on the page
+    GRAPHQL_TWEET_OPERATIONS = ('SearchTimeline', 'TweetResultByRestId')
+
+    # Return the outerHTML of tweet articles not returned before and mark
+    # them, so each scroll only ships and parses newly rendered tweets
+    NEW_ARTICLES_JS = """
+        let articles = document.querySelectorAll('article[data-testid="tweet"]');
+        if (!articles.length) {
+            articles = document.querySelectorAll('article[role="article"]');
+        }
+        const fresh = [];
+        for (const el of articles) {
+            if (el.getAttribute('data-scraped') !== '1') {
+                el.setAttribute('data-scraped', '1');
+                fresh.push(el.outerHTML);
+            }
+        }
+        return fresh;
+    """
+
+    # Click every popup close button in one round trip; returns how many
+    CLOSE_POPUPS_JS = """
+        let clicked = 0;
+        document.querySelectorAll('[aria-label="Close"]').forEach(b => {
+            try { b.click(); clicked++; } catch (e) {}
+        });
+        return clicked;
+    """
+
     def __init__(self, config: dict, logger: Optional[Logger] = None):
         """
         Initialize Twitter scraper.
@@ -512,12 +554,43 @@ class TwitterScraper:
         # self.stealth_driver = StealthDriver(...)
         self.driver = None
 
-        # Tracking
+        # Number of browsers scraping hashtags concurrently
+        self.pool_size = max(1, self.browser_config.get("pool_size", 1))
+
+        # Tracking (locks guard shared state when hashtags run in parallel)
         self.collected_tweets: List[Dict] = []
-        self.seen_tweet_ids: Set[str] = set()
+        # Dedup keys of collected tweets as ints (see _dedup_key)
+        self.seen_tweet_ids: Set[int] = set()
+        self._tweets_by_hashtag: Dict[str, List[Dict]] = defaultdict(list)
         self.request_count = 0
         self.last_request_time = time.time()
 
+        # Token bucket: refills at requests_per_minute, holds up to
+        # burst_capacity requests so short bursts don't wait
+        self._rate = self.rate_limit_config.get("requests_per_minute", 30) / 60.0
+        self._bucket_capacity = float(self.rate_limit_config.get("burst_capacity", 1))
+        self._tokens = self._bucket_capacity
+        self._last_refill = time.monotonic()
+        self._tweets_lock = threading.Lock()
+        self._rate_limit_lock = threading.Lock()
+
+        # Set once a scrape_hashtags call has collected its target count,
+        # so hashtags still scraping (or queued for a browser) stop early
+        self._target_count: Optional[int] = None
+        self._target_reached = threading.Event()
+
+        # Append-only JSONL checkpoint for this session and how many
+        # collected tweets it already holds
+        self._checkpoint_file: Optional[Path] = None
+        self._checkpoint_written_upto = 0
+        self._checkpoint_lock = threading.Lock()
+
+        # Parses fetched articles while the browser scrolls to the next batch
+        self._parse_pool = ThreadPoolExecutor(max_workers=2)
+
+        # GraphQL request ids per driver whose response body hasn't finished loading
+        self._pending_graphql_requests: Dict[int, Set[str]] = defaultdict(set)
+
         self.logger.info("TwitterScraper initialized")
 
     # ---------------------------------------------------------------------
@@ -539,6 +612,21 @@ class TwitterScraper:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
+
+        # Text scraping needs no images or notification prompts; CSS stays
+        # on so the timeline lays out and lazy-loads as usual
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+        # Return from driver.get() at once; _wait_for_tweets waits for the
+        # first tweets instead of the full page load
+        chrome_options.page_load_strategy = "none"
+
+        # Log network events so GraphQL responses can be read over CDP
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
         chrome_options.add_argument(
             "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36"
@@ -596,47 +684,109 @@ class TwitterScraper:
 
         tweets_per_hashtag = target_count // len(hashtags)
 
-        for hashtag in hashtags:
-            self.logger.info(f"Scraping hashtag: {hashtag}")
+        self._target_count = target_count
+        self._target_reached.clear()
+        if len(self.collected_tweets) >= target_count:
+            self._target_reached.set()
 
-            try:
-                hashtag_tweets = self._scrape_single_hashtag(
-                    hashtag,
-                    target_count=tweets_per_hashtag,
-                    time_window_hours=time_window_hours
-                )
-
-                self.logger.info(
-                    f"Collected {len(hashtag_tweets)} tweets for {hashtag}"
-                )
-
-                # Save checkpoint
-                if self.checkpoint_config.get("enabled", True):
-                    self._save_checkpoint()
+        if self.pool_size > 1 and len(hashtags) > 1:
+            asyncio.run(
+                self._scrape_hashtags_pooled(hashtags, tweets_per_hashtag, time_window_hours)
+            )
+        else:
+            for hashtag in hashtags:
+                self._scrape_hashtag_task(hashtag, tweets_per_hashtag, time_window_hours)
 
                 # Check if we've reached target
-                if len(self.collected_tweets) >= target_count:
-                    self.logger.info(
-                        f"Reached target count: {len(self.collected_tweets)}"
-                    )
+                if self._target_reached.is_set():
                     break
 
-            except Exception as e:
-                self.logger.error(f"Error scraping {hashtag}: {e}", exc_info=True)
-                continue
+        if self._target_reached.is_set():
+            self.logger.info(
+                f"Reached target count: {len(self.collected_tweets)}"
+            )
 
         self.logger.info(
             f"Scraping complete. Total tweets collected: {len(self.collected_tweets)}"
         )
         return self.collected_tweets
 
+    async def _scrape_hashtags_pooled(
+        self,
+        hashtags: List[str],
+        tweets_per_hashtag: int,
+        time_window_hours: int
+    ):
+        """
+        Scrape hashtags concurrently, each on a browser from a DriverPool.
+
+        The scraper's own driver joins the pool, so only pool_size - 1
+        extra browsers are launched. Blocking Selenium calls run in worker
+        threads; rate limiting stays shared across all of them.
+        """
+        pool = DriverPool(
+            self.setup_driver,
+            size=min(self.pool_size, len(hashtags)),
+            drivers=[self.driver],
+            logger=self.logger
+        )
+        await pool.start()
+
+        async def scrape_one(hashtag: str):
+            driver = await pool.acquire()
+            try:
+                # Hashtags still waiting for a browser are skipped once the target is met
+                if self._target_reached.is_set():
+                    return
+                await asyncio.to_thread(
+                    self._scrape_hashtag_task, hashtag, tweets_per_hashtag, time_window_hours, driver
+                )
+            finally:
+                pool.release(driver)
+
+        try:
+            await asyncio.gather(*(scrape_one(hashtag) for hashtag in hashtags))
+        finally:
+            pool.close()
+
+    def _scrape_hashtag_task(
+        self,
+        hashtag: str,
+        target_count: int,
+        time_window_hours: int,
+        driver=None
+    ):
+        """Scrape one hashtag and save a checkpoint, logging any error."""
+        self.logger.info(f"Scraping hashtag: {hashtag}")
+
+        try:
+            hashtag_tweets = self._scrape_single_hashtag(
+                hashtag,
+                target_count=target_count,
+                time_window_hours=time_window_hours,
+                driver=driver
+            )
+
+            self.logger.info(
+                f"Collected {len(hashtag_tweets)} tweets for {hashtag}"
+            )
+
+            # Save checkpoint
+            if self.checkpoint_config.get("enabled", True):
+                self._save_checkpoint()
+
+        except Exception as e:
+            self.logger.error(f"Error scraping {hashtag}: {e}", exc_info=True)
+
     def _scrape_single_hashtag(
         self,
         hashtag: str,
         target_count: int,
-        time_window_hours: int
+        time_window_hours: int,
+        driver=None
     ) -> List[Dict]:
-        """Scrape tweets for a single hashtag."""
+        """Scrape tweets for a single hashtag (on the given driver, or the scraper's own)."""
+        driver = driver or self.driver
         search_term = hashtag.strip().lstrip('#')
 
         # Using advanced search: recent tweets, not retweets
@@ -648,11 +798,12 @@ class TwitterScraper:
         self.logger.info(f"Navigating to: {search_url}")
 
         try:
-            self.driver.get(search_url)
-            human_delay(3, 5)  # Wait for page load
+            driver.get(search_url)
+            self._wait_for_tweets(driver)
+            human_delay(1, 2)
 
             # Handle any popups/login prompts
-            self._handle_popups()
+            self._handle_popups(driver)
 
             # Scroll and collect tweets
             tweets_collected = 0
@@ -661,20 +812,25 @@ class TwitterScraper:
                 "max_continuous_scrolls", 50
             )
 
-            while tweets_collected < target_count and scroll_attempts < max_scroll_attempts:
-                # Extract tweets from current page
-                new_tweets = self._extract_tweets_from_page()
-
-                if new_tweets:
-                    tweets_collected += len(new_tweets)
-                    self.logger.debug(
-                        f"Extracted {len(new_tweets)} new tweets. "
-                        f"Total: {tweets_collected}/{target_count}"
+            while (
+                tweets_collected < target_count
+                and scroll_attempts < max_scroll_attempts
+                and not self._target_reached.is_set()
+            ):
+                # Fetch new GraphQL responses (or, failing that, newly
+                # rendered articles) and parse them in the background while
+                # the page scrolls
+                responses = self._fetch_graphql_responses(driver)
+                if responses:
+                    parsed = self._parse_pool.submit(self._parse_graphql_responses, responses)
+                else:
+                    parsed = self._parse_pool.submit(
+                        self._parse_articles, self._fetch_new_articles(driver)
                     )
 
                 # Scroll down (we kept HumanBehavior from your anti_detection)
                 has_more = HumanBehavior.random_scroll(
-                    self.driver,
+                    driver,
                     scroll_pause_min=self.anti_detection_config
                     .get("scroll_pause", {})
                     .get("min", 1),
@@ -683,6 +839,15 @@ class TwitterScraper:
                     .get("max", 3)
                 )
 
+                new_tweets = self._collect_new_tweets(parsed.result())
+
+                if new_tweets:
+                    tweets_collected += len(new_tweets)
+                    self.logger.debug(
+                        f"Extracted {len(new_tweets)} new tweets. "
+                        f"Total: {tweets_collected}/{target_count}"
+                    )
+
                 scroll_attempts += 1
 
                 # Rate limiting
@@ -699,65 +864,244 @@ class TwitterScraper:
                     self.logger.warning("No more content available")
                     break
 
-            # filter the ones for this hashtag
-            return [
-                t for t in self.collected_tweets
-                if hashtag.lower() in t.get('hashtags_lower', [])
-            ]
+            # the ones for this hashtag, in collection order
+            with self._tweets_lock:
+                return list(self._tweets_by_hashtag.get(hashtag.lower(), []))
 
         except Exception as e:
             self.logger.error(f"Error during scraping: {e}", exc_info=True)
             return []
 
-    def _extract_tweets_from_page(self) -> List[Dict]:
-        """Extract tweets from the current page."""
-        new_tweets = []
+    def _extract_tweets_from_page(self, driver=None) -> List[Dict]:
+        """Extract tweets loaded or rendered since the last call."""
+        responses = self._fetch_graphql_responses(driver)
+        if responses:
+            return self._collect_new_tweets(self._parse_graphql_responses(responses))
+        return self._collect_new_tweets(self._parse_articles(self._fetch_new_articles(driver)))
+
+    def _fetch_graphql_responses(self, driver=None) -> List[bytes]:
+        """
+        Fetch the bodies of tweet GraphQL responses received since the
+        last call, read from the performance log over CDP.
+
+        Returns an empty list when the browser doesn't log network events.
+        """
+        driver = driver or self.driver
+        pending = self._pending_graphql_requests[id(driver)]
 
         try:
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            entries = driver.get_log('performance')
+        except Exception as e:
+            self.logger.debug(f"Performance log unavailable: {e}")
+            return []
 
-            # Find tweet articles
-            articles = soup.find_all('article', attrs={'data-testid': 'tweet'})
-            if not articles:
-                articles = soup.find_all('article', role='article')
+        finished = []
+        for entry in entries:
+            try:
+                message = orjson.loads(entry['message'])['message']
+            except Exception:
+                continue
 
-            self.logger.debug(f"Found {len(articles)} article elements")
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.responseReceived':
+                url = params.get('response', {}).get('url', '')
+                if '/graphql/' in url and any(op in url for op in self.GRAPHQL_TWEET_OPERATIONS):
+                    pending.add(params['requestId'])
+            elif method == 'Network.loadingFinished' and params.get('requestId') in pending:
+                pending.discard(params['requestId'])
+                finished.append(params['requestId'])
+
+        bodies = []
+        for request_id in finished:
+            try:
+                response = driver.execute_cdp_cmd(
+                    'Network.getResponseBody', {'requestId': request_id}
+                )
+            except Exception as e:
+                self.logger.debug(f"Error fetching GraphQL response {request_id}: {e}")
+                continue
+            body = response.get('body', '')
+            if response.get('base64Encoded'):
+                body = base64.b64decode(body)
+            bodies.append(body)
+        return bodies
 
-            for article in articles:
-                try:
-                    tweet_data = self._parse_tweet_element(article)
+    def _parse_graphql_responses(self, bodies: List[bytes]) -> List[Dict]:
+        """
+        Parse GraphQL response bodies into tweet dictionaries.
 
-                    if tweet_data and self._is_new_tweet(tweet_data):
-                        self.collected_tweets.append(tweet_data)
-                        new_tweets.append(tweet_data)
-                        self.seen_tweet_ids.add(tweet_data['tweet_id'])
+        Like _parse_articles, touches no driver or shared tracking state.
+        """
+        tweets = []
+        for body in bodies:
+            try:
+                payload = orjson.loads(body)
+            except orjson.JSONDecodeError as e:
+                self.logger.debug(f"Error decoding GraphQL response: {e}")
+                continue
 
+            for result in self._iter_tweet_results(payload):
+                try:
+                    tweet_data = self._parse_tweet_result(result)
+                    if tweet_data:
+                        tweets.append(tweet_data)
                 except Exception as e:
-                    self.logger.debug(f"Error parsing tweet: {e}")
-                    continue
+                    self.logger.debug(f"Error parsing tweet result: {e}")
+
+        self.logger.debug(f"Parsed {len(tweets)} tweets from {len(bodies)} GraphQL responses")
+        return tweets
+
+    @staticmethod
+    def _iter_tweet_results(payload: Dict):
+        """Yield the tweet results in a SearchTimeline or TweetResultByRestId payload."""
+        data = payload.get('data') or {}
+
+        tweet_result = data.get('tweetResult')
+        if tweet_result:
+            yield tweet_result.get('result')
+
+        timeline = (
+            ((data.get('search_by_raw_query') or {}).get('search_timeline') or {})
+            .get('timeline') or {}
+        )
+        for instruction in timeline.get('instructions', []):
+            entries = instruction.get('entries') or [instruction.get('entry') or {}]
+            for entry in entries:
+                content = entry.get('content') or {}
+                # Single tweets carry itemContent, conversation modules a list of items
+                items = [content.get('itemContent')] + [
+                    (item.get('item') or {}).get('itemContent') for item in content.get('items', [])
+                ]
+                for item in items:
+                    if item and item.get('tweet_results'):
+                        yield item['tweet_results'].get('result')
+
+    def _parse_tweet_result(self, result: Optional[Dict]) -> Optional[Dict]:
+        """Parse a GraphQL tweet result into the same dictionary _parse_tweet_element builds."""
+        if result and result.get('__typename') == 'TweetWithVisibilityResults':
+            result = result.get('tweet')
+        if not result or 'legacy' not in result:
+            return None
+
+        legacy = result['legacy']
+        tweet_id = legacy.get('id_str') or result.get('rest_id')
+        if not tweet_id or self._dedup_key(tweet_id) in self.seen_tweet_ids:
+            return None
+
+        # Long tweets keep their full text in note_tweet
+        note = (((result.get('note_tweet') or {}).get('note_tweet_results') or {}).get('result') or {})
+        content = note.get('text') or legacy.get('full_text')
 
+        # Validate content
+        if not is_valid_tweet_content(content):
+            return None
+
+        user = ((result.get('core') or {}).get('user_results') or {}).get('result') or {}
+        username = (
+            (user.get('core') or {}).get('screen_name')
+            or (user.get('legacy') or {}).get('screen_name')
+        )
+
+        # Same ISO format as the <time datetime="..."> attribute
+        timestamp = None
+        if legacy.get('created_at'):
+            timestamp = (
+                datetime.strptime(legacy['created_at'], '%a %b %d %H:%M:%S %z %Y')
+                .astimezone(timezone.utc)
+                .strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            )
+
+        entities = legacy.get('entities') or {}
+        hashtags = [f"#{tag['text']}" for tag in entities.get('hashtags', [])]
+        mentions = [f"@{user_mention['screen_name']}" for user_mention in entities.get('user_mentions', [])]
+
+        return {
+            'tweet_id': tweet_id,
+            'username': username or 'unknown',
+            'timestamp': timestamp or datetime.now().isoformat(),
+            'content': content,
+            'hashtags': hashtags,
+            'hashtags_lower': [h.lower() for h in hashtags],
+            'mentions': mentions,
+            'likes': int(legacy.get('favorite_count') or 0),
+            'retweets': int(legacy.get('retweet_count') or 0),
+            'replies': int(legacy.get('reply_count') or 0),
+            'views': int((result.get('views') or {}).get('count') or 0),
+            'scraped_at': datetime.now().isoformat()
+        }
+
+    def _fetch_new_articles(self, driver=None) -> List[str]:
+        """Fetch the HTML of tweet articles rendered since the last call."""
+        try:
+            return (driver or self.driver).execute_script(self.NEW_ARTICLES_JS) or []
         except Exception as e:
             self.logger.error(f"Error extracting tweets: {e}")
+            return []
 
+    def _parse_articles(self, chunks: List[str]) -> List[Dict]:
+        """
+        Parse article HTML into tweet dictionaries.
+
+        Touches no driver or shared tracking state, so it can run on the
+        parse pool while the scraping thread keeps using the browser.
+        """
+        if not chunks:
+            return []
+
+        tree = LexborHTMLParser("".join(chunks))
+        articles = tree.css('article')
+
+        self.logger.debug(f"Found {len(articles)} new article elements")
+
+        tweets = []
+        for article in articles:
+            try:
+                tweet_data = self._parse_tweet_element(article)
+                if tweet_data:
+                    tweets.append(tweet_data)
+            except Exception as e:
+                self.logger.debug(f"Error parsing tweet: {e}")
+        return tweets
+
+    def _collect_new_tweets(self, tweets: List[Dict]) -> List[Dict]:
+        """Record parsed tweets not seen before and return them."""
+        new_tweets = []
+        with self._tweets_lock:
+            for tweet_data in tweets:
+                if self._is_new_tweet(tweet_data):
+                    self.collected_tweets.append(tweet_data)
+                    new_tweets.append(tweet_data)
+                    self.seen_tweet_ids.add(self._dedup_key(tweet_data['tweet_id']))
+                    for tag in set(tweet_data.get('hashtags_lower', [])):
+                        self._tweets_by_hashtag[tag].append(tweet_data)
+            if self._target_count is not None and len(self.collected_tweets) >= self._target_count:
+                self._target_reached.set()
         return new_tweets
 
     def _parse_tweet_element(self, article) -> Optional[Dict]:
         """Parse a single tweet article element."""
         try:
+            # Use the tweet's status id when its permalink is present, and
+            # skip tweets already collected before parsing anything else
+            time_elem = article.css_first('time')
+            tweet_id = self._extract_status_id(article, time_elem)
+            if tweet_id is not None and self._dedup_key(tweet_id) in self.seen_tweet_ids:
+                return None
+
             # Extract username
             username = None
-            username_elem = article.find('div', attrs={'data-testid': 'User-Name'})
-            if username_elem:
-                username_link = username_elem.find('a')
-                if username_link and 'href' in username_link.attrs:
-                    username = username_link['href'].strip('/').split('/')[0]
+            username_link = article.css_first('div[data-testid="User-Name"] a')
+            if username_link is not None:
+                href = username_link.attributes.get('href')
+                if href is not None:
+                    username = href.strip('/').split('/')[0]
 
             # Extract tweet text
             content = None
-            tweet_text_elem = article.find('div', attrs={'data-testid': 'tweetText'})
-            if tweet_text_elem:
-                content = tweet_text_elem.get_text(strip=True)
+            tweet_text_elem = article.css_first('div[data-testid="tweetText"]')
+            if tweet_text_elem is not None:
+                content = tweet_text_elem.text(deep=True, strip=True)
 
             # Validate content
             if not is_valid_tweet_content(content):
@@ -765,19 +1109,19 @@ class TwitterScraper:
 
             # Extract timestamp
             timestamp = None
-            time_elem = article.find('time')
-            if time_elem and 'datetime' in time_elem.attrs:
-                timestamp = time_elem['datetime']
+            if time_elem is not None:
+                timestamp = time_elem.attributes.get('datetime')
 
             # Extract engagement metrics
             engagement = self._extract_engagement_metrics(article)
 
             # Extract hashtags and mentions
-            hashtags = self._extract_hashtags(tweet_text_elem) if tweet_text_elem else []
-            mentions = self._extract_mentions(tweet_text_elem) if tweet_text_elem else []
+            hashtags = self._extract_hashtags(tweet_text_elem) if tweet_text_elem is not None else []
+            mentions = self._extract_mentions(tweet_text_elem) if tweet_text_elem is not None else []
 
-            # Generate unique ID
-            tweet_id = generate_hash(f"{username}_{content}_{timestamp}")
+            # Generate unique ID when the status id is unavailable
+            if tweet_id is None:
+                tweet_id = generate_hash(f"{username}_{content}_{timestamp}")
 
             tweet_data = {
                 'tweet_id': tweet_id,
@@ -800,6 +1144,17 @@ class TwitterScraper:
             self.logger.debug(f"Error parsing tweet element: {e}")
             return None
 
+    def _extract_status_id(self, article, time_elem=None) -> Optional[str]:
+        """Extract the tweet's status id from its timestamp permalink (or first status link)."""
+        link = time_elem.parent if time_elem is not None else None
+        if link is None or link.tag != 'a':
+            link = article.css_first('a[href*="/status/"]')
+        if link is None:
+            return None
+
+        match = self.STATUS_ID_PATTERN.search(link.attributes.get('href') or '')
+        return match.group(1) if match else None
+
     def _extract_engagement_metrics(self, article) -> Dict[str, int]:
         """Extract engagement metrics from tweet article."""
         from ..utils.helpers import parse_engagement_count
@@ -812,19 +1167,19 @@ class TwitterScraper:
         }
 
         try:
-            buttons = article.find_all(['button', 'span', 'div'], attrs={'aria-label': True})
+            buttons = article.css('button[aria-label], span[aria-label], div[aria-label]')
 
             for button in buttons:
-                label = button.get('aria-label', '').lower()
+                label = (button.attributes.get('aria-label') or '').lower()
 
                 if 'like' in label or 'likes' in label:
-                    metrics['likes'] = parse_engagement_count(button.get_text())
+                    metrics['likes'] = parse_engagement_count(button.text(deep=True))
                 elif 'retweet' in label or 'repost' in label:
-                    metrics['retweets'] = parse_engagement_count(button.get_text())
+                    metrics['retweets'] = parse_engagement_count(button.text(deep=True))
                 elif 'repl' in label:
-                    metrics['replies'] = parse_engagement_count(button.get_text())
+                    metrics['replies'] = parse_engagement_count(button.text(deep=True))
                 elif 'view' in label:
-                    metrics['views'] = parse_engagement_count(button.get_text())
+                    metrics['views'] = parse_engagement_count(button.text(deep=True))
 
         except Exception:
             pass
@@ -833,91 +1188,139 @@ class TwitterScraper:
 
     def _extract_hashtags(self, element) -> List[str]:
         """Extract hashtags from tweet element."""
-        hashtags = []
         try:
-            hashtag_links = element.find_all('a', href=lambda x: x and '/hashtag/' in x)
-            for link in hashtag_links:
-                hashtag = link.get_text(strip=True)
-                if hashtag.startswith('#'):
-                    hashtags.append(hashtag)
+            return [
+                hashtag for link in element.css(self.HASHTAG_LINK_SELECTOR)
+                if (hashtag := link.text(deep=True, strip=True)).startswith('#')
+            ]
         except Exception:
-            pass
-        return hashtags
+            return []
 
     def _extract_mentions(self, element) -> List[str]:
         """Extract mentions from tweet element."""
-        mentions = []
         try:
-            mention_links = element.find_all(
-                'a',
-                href=lambda x: x and x.startswith('/') and '/hashtag/' not in x
-            )
-            for link in mention_links:
-                mention = link.get_text(strip=True)
-                if mention.startswith('@'):
-                    mentions.append(mention)
+            return [
+                mention for link in element.css(self.MENTION_LINK_SELECTOR)
+                if (mention := link.text(deep=True, strip=True)).startswith('@')
+            ]
         except Exception:
-            pass
-        return mentions
+            return []
 
     def _is_new_tweet(self, tweet_data: Dict) -> bool:
         """Check if tweet is new (not already collected)."""
-        return tweet_data['tweet_id'] not in self.seen_tweet_ids
+        return self._dedup_key(tweet_data['tweet_id']) not in self.seen_tweet_ids
+
+    @staticmethod
+    def _dedup_key(tweet_id: str) -> int:
+        """
+        Compact int key for a tweet id.
+
+        Status ids are numeric and used as-is; hashed ids (hex digests) are
+        reduced to their first 64 bits. Small ints take a third of the
+        memory of id strings in seen_tweet_ids and hash faster.
+        """
+        if tweet_id.isdigit():
+            return int(tweet_id)
+        return int(tweet_id[:16], 16)
+
+    def _wait_for_tweets(self, driver, timeout: float = 20):
+        """
+        Wait until the first tweet article is rendered, then stop loading
+        any remaining page resources.
+        """
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'article'))
+            )
+            driver.execute_script("window.stop();")
+        except TimeoutException:
+            self.logger.warning(f"No tweets rendered within {timeout}s")
 
-    def _handle_popups(self):
+    def _handle_popups(self, driver=None):
         """Handle any popups or modals that appear."""
         try:
-            close_buttons = self.driver.find_elements(By.CSS_SELECTOR, '[aria-label="Close"]')
-            for button in close_buttons:
-                try:
-                    button.click()
-                    human_delay(0.5, 1)
-                except Exception:
-                    pass
+            if (driver or self.driver).execute_script(self.CLOSE_POPUPS_JS):
+                human_delay(0.5, 1)
         except Exception:
             pass
 
     def _enforce_rate_limit(self):
-        """Enforce rate limiting to avoid detection."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        min_delay = 60.0 / self.rate_limit_config.get("requests_per_minute", 30)
+        """Enforce rate limiting to avoid detection (token bucket)."""
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._bucket_capacity,
+                self._tokens + (now - self._last_refill) * self._rate
+            )
+            self._last_refill = now
 
-        if time_since_last < min_delay:
-            sleep_time = min_delay - time_since_last
-            time.sleep(sleep_time)
+            if self._tokens < 1.0:
+                # Wait until one token has accrued, then spend it
+                time.sleep((1.0 - self._tokens) / self._rate)
+                self._tokens = 0.0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1.0
 
-        self.last_request_time = time.time()
-        self.request_count += 1
+            self.last_request_time = time.time()
+            self.request_count += 1
 
     def _save_checkpoint(self):
-        """Save current progress to checkpoint file."""
+        """
+        Append tweets collected since the last checkpoint to this session's
+        JSONL checkpoint file, one tweet per line.
+        """
         if not self.checkpoint_config.get("enabled", True):
             return
 
         try:
-            checkpoint_dir = Path(self.checkpoint_config.get("save_path", "data/raw/checkpoints"))
-            checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            with self._checkpoint_lock:
+                if self._checkpoint_file is None:
+                    checkpoint_dir = Path(self.checkpoint_config.get("save_path", "data/raw/checkpoints"))
+                    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+                    self._checkpoint_file = (
+                        checkpoint_dir / f"checkpoint_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+                    )
 
-            checkpoint_file = checkpoint_dir / f"checkpoint_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                # Snapshot under the lock; other hashtags may still be collecting
+                with self._tweets_lock:
+                    tweets = self.collected_tweets[self._checkpoint_written_upto:]
 
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'tweets': self.collected_tweets,
-                    'seen_ids': list(self.seen_tweet_ids),
-                    'count': len(self.collected_tweets),
-                    'timestamp': datetime.now().isoformat()
-                }, f, ensure_ascii=False, indent=2)
+                with open(self._checkpoint_file, 'ab') as f:
+                    f.write(b''.join(orjson.dumps(tweet, option=orjson.OPT_APPEND_NEWLINE) for tweet in tweets))
+                self._checkpoint_written_upto += len(tweets)
 
-            self.logger.info(f"Checkpoint saved: {checkpoint_file}")
+            self.logger.info(
+                f"Checkpoint saved: {self._checkpoint_file} "
+                f"(+{len(tweets)}, total {self._checkpoint_written_upto})"
+            )
 
         except Exception as e:
             self.logger.error(f"Error saving checkpoint: {e}")
 
+    def _save_checkpoint_summary(self):
+        """Write the session's seen tweet ids next to its JSONL checkpoint."""
+        if self._checkpoint_file is None:
+            return
+
+        try:
+            with self._tweets_lock:
+                seen_ids = list(map(str, self.seen_tweet_ids))
+
+            summary_file = self._checkpoint_file.with_suffix('.seen.json')
+            summary_file.write_bytes(orjson.dumps({
+                'seen_ids': seen_ids,
+                'count': self._checkpoint_written_upto,
+                'timestamp': datetime.now().isoformat()
+            }))
+        except Exception as e:
+            self.logger.error(f"Error saving checkpoint summary: {e}")
+
     def close(self):
         """Close the scraper and cleanup resources."""
         self.logger.info("Closing scraper...")
+        self._parse_pool.shutdown(wait=False, cancel_futures=True)
+        self._save_checkpoint_summary()
         if self.driver:
             try:
                 self.driver.quit()
@@ -2,7 +2,6 @@
 Common utility functions used across the application.
 """
 
-import hashlib
 import random
 import time
 from datetime import datetime, timedelta
@@ -10,20 +9,21 @@ from functools import wraps
 from typing import Any, Callable, List, Optional
 
 import psutil
+from blake3 import blake3
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 
 def generate_hash(content: str) -> str:
     """
-    Generate SHA256 hash of content for deduplication.
+    Generate BLAKE3 hash of content for deduplication.
     
     Args:
         content: Text content to hash
         
     Returns:
-        Hexadecimal hash string
+        Hexadecimal hash string (16-byte digest, 32 characters)
     """
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    return blake3(content.encode('utf-8')).hexdigest(length=16)
 
 
 def get_random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> float:
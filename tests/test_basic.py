@@ -2,9 +2,12 @@
 Basic tests for Twitter Market Intelligence System.
 """
 
+import pandas as pd
 import pytest
+from src.analyzer import SignalGenerator
 from src.utils import generate_hash, is_valid_tweet_content, parse_engagement_count
-from src.processor import DataCleaner, Deduplicator
+from src.processor import DataCleaner, Deduplicator, ParquetStorage
+from src.scraper import TwitterScraper
 
 
 def test_generate_hash():
@@ -14,7 +17,8 @@ def test_generate_hash():
     hash2 = generate_hash(content)
     
     assert hash1 == hash2
-    assert len(hash1) == 64  # SHA256 produces 64 character hex string
+    assert len(hash1) == 32  # 16-byte BLAKE3 digest as hex
+    assert generate_hash("Other content") != hash1
 
 
 def test_is_valid_tweet_content():
@@ -34,6 +38,67 @@ def test_parse_engagement_count():
     assert parse_engagement_count("-") == 0
 
 
+def test_parse_graphql_search_timeline():
+    """Test GraphQL SearchTimeline results parse into the same tweet dicts as articles."""
+    from selectolax.lexbor import LexborHTMLParser
+    
+    def tweet_result(tweet_id, **extra):
+        return {
+            "__typename": "Tweet",
+            "rest_id": tweet_id,
+            "core": {"user_results": {"result": {"legacy": {"screen_name": "trader"}}}},
+            "views": {"count": "1234"},
+            "legacy": {
+                "id_str": tweet_id,
+                "full_text": "Nifty rallies past resistance #Nifty50 @NSEIndia https://t.co/x",
+                "created_at": "Mon Jan 01 10:30:00 +0000 2024",
+                "favorite_count": 12,
+                "retweet_count": 3,
+                "reply_count": 1,
+                "entities": {
+                    "hashtags": [{"text": "Nifty50"}],
+                    "user_mentions": [{"screen_name": "NSEIndia"}],
+                },
+            },
+            **extra,
+        }
+    
+    long_text = "A long note tweet about #Nifty50 " * 20
+    payload = {"data": {"search_by_raw_query": {"search_timeline": {"timeline": {"instructions": [
+        {"type": "TimelineAddEntries", "entries": [
+            {"content": {"itemContent": {"tweet_results": {"result": tweet_result("101")}}}},
+            {"content": {"itemContent": {"tweet_results": {"result": {
+                "__typename": "TweetWithVisibilityResults",
+                "tweet": tweet_result("102", note_tweet={
+                    "note_tweet_results": {"result": {"text": long_text}}
+                }),
+            }}}}},
+            {"content": {"cursorType": "Bottom", "value": "cursor"}},
+        ]},
+    ]}}}}}
+    
+    scraper = TwitterScraper({"scraper": {"checkpoint": {"enabled": False}}})
+    tweets = [scraper._parse_tweet_result(result) for result in scraper._iter_tweet_results(payload)]
+    
+    assert [tweet["tweet_id"] for tweet in tweets] == ["101", "102"]
+    assert tweets[0]["username"] == "trader"
+    assert tweets[0]["timestamp"] == "2024-01-01T10:30:00.000Z"
+    assert tweets[0]["hashtags"] == ["#Nifty50"]
+    assert tweets[0]["hashtags_lower"] == ["#nifty50"]
+    assert tweets[0]["mentions"] == ["@NSEIndia"]
+    assert (tweets[0]["likes"], tweets[0]["retweets"], tweets[0]["replies"]) == (12, 3, 1)
+    assert tweets[0]["views"] == 1234
+    assert tweets[1]["content"] == long_text
+    
+    article = LexborHTMLParser(
+        '<article><div data-testid="User-Name"><a href="/trader">Trader</a></div>'
+        '<a href="/trader/status/103"><time datetime="2024-01-01T10:30:00.000Z"></time></a>'
+        '<div data-testid="tweetText">Nifty rallies past resistance '
+        '<a href="/hashtag/Nifty50">#Nifty50</a></div></article>'
+    ).css_first('article')
+    assert list(tweets[0]) == list(scraper._parse_tweet_element(article))
+
+
 def test_data_cleaner():
     """Test data cleaner initialization."""
     config = {
@@ -91,6 +156,36 @@ def test_deduplication_by_content_hash():
     assert len(unique) == 2
 
 
+def test_fuzzy_deduplication():
+    """Test fuzzy deduplication of near-duplicate tweets."""
+    config = {
+        "processor": {
+            "deduplication": {
+                "method": "fuzzy",
+                "similarity_threshold": 0.75
+            }
+        }
+    }
+    
+    tweets = [
+        {"content": "AAPL breaking out to new highs today"},
+        {"content": "aapl breaking out to new highs today!"},  # 6/8 words shared
+        {"content": "AAPL breaking out to new highs"},  # Subset of the first
+        {"content": "TSLA looks weak into earnings"},
+        {"content": ""},
+        {"content": ""},  # Duplicate empty
+    ]
+    
+    dedup = Deduplicator(config)
+    unique = dedup.deduplicate(tweets)
+    
+    assert [t["content"] for t in unique] == [
+        "AAPL breaking out to new highs today",
+        "TSLA looks weak into earnings",
+        "",
+    ]
+
+
 def test_text_cleaning():
     """Test text cleaning."""
     config = {
@@ -114,5 +209,189 @@ def test_text_cleaning():
     assert "@user" in cleaned
 
 
+def test_text_cleaning_url_after_mention():
+    """Test URLs are removed before a mention or hashtag right in front of them."""
+    config = {
+        "processor": {
+            "cleaning": {},
+            "normalization": {
+                "remove_urls": True,
+                "remove_mentions": True,
+                "remove_hashtags": True
+            }
+        }
+    }
+    
+    cleaner = DataCleaner(config)
+    texts = ["see @abchttp://x.com ok", "#taghttps://y.io z"]
+    
+    assert [cleaner.clean_text(text) for text in texts] == ["see ok", "z"]
+    assert list(cleaner._clean_content(pd.Series(texts, dtype=object))) == ["see ok", "z"]
+
+
+def test_dataframe_cleaning_and_deduplication():
+    """Test DataFrame cleaning and deduplication."""
+    config = {
+        "processor": {
+            "cleaning": {"min_content_length": 10},
+            "deduplication": {"method": "content_hash"}
+        }
+    }
+    
+    df = pd.DataFrame({
+        "content": [
+            "Tweet one https://example.com about markets",
+            "RT @user: retweeted content here",
+            "short",
+            "Tweet one https://example.com about markets",
+        ],
+        "username": ["user1", "user2", "user3", "user1"],
+    })
+    
+    cleaned = DataCleaner(config).clean_dataframe(df)
+    unique = Deduplicator(config).deduplicate_dataframe(cleaned)
+    
+    assert len(cleaned) == 2
+    assert len(unique) == 1
+    assert unique["content"].iloc[0] == "Tweet one about markets"
+
+
+def test_load_parquet_directory(tmp_path):
+    """Test loading a directory of Parquet part files."""
+    config = {"storage": {"paths": {}}}
+    storage = ParquetStorage(config)
+    
+    storage._save_to_parquet([{"content": "Tweet 1", "username": "user1"}], str(tmp_path / "part-0.parquet"))
+    storage._save_to_parquet([{"content": "Tweet 2", "username": "user2"}], str(tmp_path / "part-1.parquet"))
+    (tmp_path / "checkpoint.json").write_text("{}")
+    
+    df = storage._load_from_parquet(str(tmp_path), columns=["content"])
+    
+    assert list(df.columns) == ["content"]
+    assert sorted(df["content"]) == ["Tweet 1", "Tweet 2"]
+    assert storage._count_parquet_rows(str(tmp_path)) == 2
+    
+    filtered = storage._load_from_parquet(str(tmp_path), filters=[("username", "==", "user2")])
+    assert list(filtered["content"]) == ["Tweet 2"]
+    assert storage._count_parquet_rows(str(tmp_path / "missing.parquet")) == 0
+
+
+def test_append_parquet(tmp_path):
+    """Test appending to an existing Parquet file."""
+    config = {"storage": {"paths": {}}}
+    storage = ParquetStorage(config)
+    path = str(tmp_path / "tweets.parquet")
+    
+    storage._save_to_parquet([{"content": "Tweet 1", "username": "user1"}], path)
+    storage._save_to_parquet([{"username": "user2", "content": "Tweet 2"}], path, append=True)
+    storage._save_to_parquet([{"content": "Tweet 3", "username": "user3", "likes": 5}], path, append=True)
+    
+    df = storage._load_from_parquet(path)
+    
+    assert list(df["content"]) == ["Tweet 1", "Tweet 2", "Tweet 3"]
+    assert df["likes"].isna().sum() == 2
+    assert list(tmp_path.iterdir()) == [tmp_path / "tweets.parquet"]
+
+
+def test_append_parquet_dataset(tmp_path):
+    """Test appends in the dataset layout add part files in write order."""
+    config = {"storage": {"paths": {}, "parquet": {"layout": "dataset"}}}
+    storage = ParquetStorage(config)
+    path = tmp_path / "tweets.parquet"
+    
+    for i in range(1, 4):
+        storage._save_to_parquet([{"content": f"Tweet {i}", "likes": None}], str(path), append=True)
+    storage._save_to_parquet([{"content": "Tweet 4", "likes": 2.5}], str(path), append=True)
+    
+    df = storage._load_from_parquet(str(path))
+    
+    assert list(df["content"]) == ["Tweet 1", "Tweet 2", "Tweet 3", "Tweet 4"]
+    assert df["likes"].tolist()[-1] == 2.5
+    assert storage._count_parquet_rows(str(path)) == 4
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_append_parquet_dataset_failed_rewrite(tmp_path, monkeypatch):
+    """Test a failed schema-unifying rewrite keeps the existing dataset."""
+    import pyarrow.dataset as ds
+    
+    config = {"storage": {"paths": {}, "parquet": {"layout": "dataset"}}}
+    storage = ParquetStorage(config)
+    path = tmp_path / "tweets.parquet"
+    storage._save_to_parquet([{"content": "Tweet 1", "likes": None}], str(path))
+    
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(ds, "write_dataset", fail)
+    with pytest.raises(OSError):
+        storage._save_to_parquet([{"content": "Tweet 2", "likes": 2.5}], str(path), append=True)
+    
+    assert list(storage._load_from_parquet(str(path))["content"]) == ["Tweet 1"]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_stream_raw_tweets(tmp_path):
+    """Test streamed raw tweets are readable once the stream is closed."""
+    path = tmp_path / "raw.parquet"
+    config = {"storage": {"paths": {"raw_data": str(path)}, "parquet": {"row_group_size": 3}}}
+    
+    with ParquetStorage(config) as storage:
+        for i in range(4):
+            storage.stream_raw_tweets([{"tweet_id": str(i), "content": f"Tweet {i}", "likes": i, "extra": True}])
+        assert not path.exists()
+    
+    df = storage.load_raw_tweets()
+    
+    assert list(df["tweet_id"]) == ["0", "1", "2", "3"]
+    assert list(df.columns) == ParquetStorage.RAW_TWEET_SCHEMA.names
+    assert storage.get_file_info(str(path))["num_rows"] == 4
+    
+    # A later stream appends to the existing raw file
+    with ParquetStorage(config) as storage:
+        storage.stream_raw_tweets([{"tweet_id": "4", "content": "Tweet 4"}])
+    
+    assert list(storage.load_raw_tweets()["tweet_id"]) == ["0", "1", "2", "3", "4"]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_load_in_chunks(tmp_path):
+    """Test chunked loads return every row in order, projected to the default columns."""
+    storage = ParquetStorage({"storage": {"paths": {}}})
+    path = str(tmp_path / "tweets.parquet")
+    storage._save_to_parquet(
+        [{"tweet_id": str(i), "content": f"Tweet {i}", "likes": i} for i in range(5)], path
+    )
+    
+    chunks = list(storage.load_in_chunks(path, chunk_size=2))
+    
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert list(pd.concat(chunks)["tweet_id"]) == ["0", "1", "2", "3", "4"]
+    assert list(chunks[0].columns) == ["tweet_id", "content"]
+    assert len(list(storage.load_in_chunks(path, chunk_size=2))) == 3
+
+
+def test_aggregate_signals_by_hashtag():
+    """Test hashtag aggregation matches an explode + groupby."""
+    signals_df = pd.DataFrame({
+        "hashtags": [["#nifty", "#sensex"], ["#nifty"], [], ["#sensex", "#nifty"]],
+        "composite_signal": [0.8, 0.6, 0.1, -0.4],
+        "sentiment_signal": [0.5, 0.4, 0.0, -0.2],
+        "engagement_score": [0.3, 0.2, 0.1, 0.6],
+        "urgency_signal": [0.0, 0.2, 0.0, 0.4],
+        "signal_strength": [0.8, 0.6, 0.1, 0.4],
+        "confidence_width": [0.4, 0.6, 0.8, 0.2],
+    })
+    generator = SignalGenerator({})
+    
+    aggregated = generator.aggregate_signals(signals_df, "hashtags", min_tweets=1)
+    expected = signals_df.explode("hashtags").groupby("hashtags")["composite_signal"].agg(["mean", "std", "count"])
+    
+    assert list(aggregated.index) == ["#nifty", "#sensex"]
+    assert aggregated.loc["#nifty", "composite_signal_mean"] == pytest.approx(expected.loc["#nifty", "mean"])
+    assert aggregated.loc["#sensex", "composite_signal_std"] == pytest.approx(expected.loc["#sensex", "std"])
+    assert aggregated["composite_signal_count"].tolist() == [3, 2]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
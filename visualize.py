@@ -25,7 +25,8 @@ def main():
     
     # Setup
     config = load_config(args.config)
-    logger = setup_logging(config.get_all())
+    cfg = config.get_all()
+    logger = setup_logging(cfg)
     
     logger.info("=" * 70)
     logger.info("VISUALIZATION GENERATION")
@@ -51,7 +52,7 @@ def main():
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Initialize visualizer
-    visualizer = Visualizer(config.get_all(), logger)
+    visualizer = Visualizer(cfg, logger)
     
     # Generate visualizations based on format
     if args.format in ['all', 'static']: